@@ -29,6 +29,7 @@
 This module contains functions for writing of Chemkin input files.
 """
 
+import functools
 import logging
 import math
 import os.path
@@ -57,6 +58,15 @@ from rmgpy.util import make_output_subdirectory
 
 _chemkin_reaction_count = None
 
+# Splits a reaction equation into reactants, arrow and products
+_REACTION_ARROW_PATTERN = re.compile(r'(<=>|=>|=)')
+# Reference temperature used for all Arrhenius expressions read from Chemkin files
+_T0 = (1, "K")
+# Labels of the inert bath gases, in upper case
+_INERT_LABELS = frozenset(['AR', 'N2', 'HE', 'NE'])
+# Matches a third body collider, e.g., '(+M)', '(+m)', or a specific species like '(+N2)'
+_COLLIDER_PATTERN = re.compile(r'\(\+[^)]+\)')
+
 ################################################################################
 
 
@@ -309,14 +319,14 @@ def _read_kinetics_reaction(line, species_dict, Aunits, Eunits):
     """
     tokens = line.split()
 
-    rmg = True
     try:
-        float(tokens[-6])
+        A = float(tokens[-6])
     except (ValueError, IndexError):
         rmg = False
+    else:
+        rmg = True
     A_uncertainty_type = '+|-'
     if rmg:
-        A = float(tokens[-6])
         n = float(tokens[-5])
         Ea = float(tokens[-4])
         try:
@@ -338,21 +348,16 @@ def _read_kinetics_reaction(line, species_dict, Aunits, Eunits):
     third_body = False
 
     # Split the reaction equation into reactants and products
-    reversible = True
-    reactants, products = reaction.split('=')
-    if '<=>' in reaction:
-        reactants = reactants[:-1]
-        products = products[1:]
-    elif '=>' in reaction:
-        products = products[1:]
-        reversible = False
+    reactants, arrow, products = _REACTION_ARROW_PATTERN.split(reaction)
+    reversible = arrow != '=>'
     specific_collider = None
     # search for a third body collider, e.g., '(+M)', '(+m)', or a specific species like '(+N2)',
     #     matching `(+anything_other_than_ending_parenthesis)`:
-    collider = re.search(r'\(\+[^)]+\)', reactants)
+    collider = _COLLIDER_PATTERN.search(reactants)
     if collider is not None:
         collider = collider.group(0)  # save string value rather than the object
-        if collider != re.search(r'\(\+[^)]+\)', products).group(0):
+        product_collider = _COLLIDER_PATTERN.search(products)
+        if product_collider is None or collider != product_collider.group(0):
             raise ChemkinError(
                 'Third body colliders in reactants and products of reaction {0} are not identical!'.format(reaction))
         extra_parenthesis = collider.count('(') - 1
@@ -431,7 +436,7 @@ def _read_kinetics_reaction(line, species_dict, Aunits, Eunits):
             A=(A, k_units, A_uncertainty_type, dA),
             n=(n, '', '+|-', dn),
             Ea=(Ea, Eunits, '+|-', dEa),
-            T0=(1, "K"),
+            T0=_T0,
         ),
     }
     return reaction, third_body, kinetics, k_units, k_low_units
@@ -444,22 +449,26 @@ def _read_kinetics_line(line, reaction, species_dict, Eunits, kunits, klow_units
     case_preserved_tokens = line.split('/')
     line = line.upper()
     tokens = line.split('/')
+    # Classify the line once by its leading keyword, rather than searching the
+    # whole line for each keyword in turn (which also misfired on collider
+    # names containing a keyword)
+    keyword = tokens[0].strip()
 
-    if 'DUP' in line:
+    if keyword in ('DUP', 'DUPLICATE'):
         # Duplicate reaction
         reaction.duplicate = True
 
-    elif 'LOW' in line:
+    elif keyword == 'LOW':
         # Low-pressure-limit Arrhenius parameters
         tokens = tokens[1].split()
         kinetics['arrhenius low'] = _kinetics.Arrhenius(
             A=(float(tokens[0].strip()), klow_units),
             n=float(tokens[1].strip()),
             Ea=(float(tokens[2].strip()), Eunits),
-            T0=(1, "K"),
+            T0=_T0,
         )
 
-    elif 'HIGH' in line:
+    elif keyword == 'HIGH':
         # What we thought was high, was in fact low-pressure
         kinetics['arrhenius low'] = kinetics['arrhenius high']
         kinetics['arrhenius low'].A = (
@@ -470,10 +479,10 @@ def _read_kinetics_line(line, reaction, species_dict, Eunits, kunits, klow_units
             A=(float(tokens[0].strip()), kunits),
             n=float(tokens[1].strip()),
             Ea=(float(tokens[2].strip()), Eunits),
-            T0=(1, "K"),
+            T0=_T0,
         )
 
-    elif 'TROE' in line:
+    elif keyword == 'TROE':
         # Troe falloff parameters
         tokens = tokens[1].split()
         alpha = float(tokens[0].strip())
@@ -490,7 +499,7 @@ def _read_kinetics_line(line, reaction, species_dict, Eunits, kunits, klow_units
             T1=(T1, "K"),
             T2=(T2, "K") if T2 is not None else None,
         )
-    elif line.strip().startswith('SRI'):
+    elif keyword == 'SRI':
         kinetics['sri'] = True
         """To define an SRI pressure-dependent reaction, in addition to the LOW or HIGH parameters, the
         keyword SRI followed by three or five parameters must be included in the following order: a, b,
@@ -499,7 +508,7 @@ def _read_kinetics_line(line, reaction, species_dict, Eunits, kunits, klow_units
         """
         # see eg. http://www.dipic.unipd.it/faculty/canu/files/Comb/Docs/chemkinCK.pdf
 
-    elif 'CHEB' in line:
+    elif keyword in ('CHEB', 'TCHEB', 'PCHEB'):
         # Chebyshev parameters
         chebyshev = kinetics.get(
             'chebyshev', _kinetics.Chebyshev(kunits=kunits))
@@ -530,7 +539,7 @@ def _read_kinetics_line(line, reaction, species_dict, Eunits, kunits, klow_units
             kinetics['chebyshev coefficients'].extend(
                 [float(t.strip()) for t in tokens2])
 
-    elif 'PLOG' in line:
+    elif keyword == 'PLOG':
         pdep_arrhenius = kinetics.get('pressure-dependent arrhenius', [])
         kinetics['pressure-dependent arrhenius'] = pdep_arrhenius
         tokens = tokens[1].split()
@@ -539,9 +548,9 @@ def _read_kinetics_line(line, reaction, species_dict, Eunits, kunits, klow_units
                                    A=(float(tokens[1].strip()), kunits),
                                    n=float(tokens[2].strip()),
                                    Ea=(float(tokens[3].strip()), Eunits),
-                                   T0=(1, "K"),
+                                   T0=_T0,
                                )])
-    elif tokens[0].startswith('REV'):
+    elif keyword == 'REV':
         reverse_A = float(tokens[1].split()[0])
         kinetics['explicit reverse'] = line.strip()
         if reverse_A == 0:
@@ -549,7 +558,7 @@ def _read_kinetics_line(line, reaction, species_dict, Eunits, kunits, klow_units
             reaction.reversible = False
         else:
             logging.info("Ignoring explicit reverse rate for reaction {0}".format(reaction))
-    elif line.strip() == 'STICK':
+    elif keyword == 'STICK':
         # Convert what we thought was Arrhenius into StickingCoefficient
         k = kinetics['arrhenius high']
         kinetics['sticking coefficient'] = _kinetics.StickingCoefficient(
@@ -799,6 +808,16 @@ def read_reaction_comments(reaction, comments, read=True):
 ################################################################################
 
 
+@functools.lru_cache(maxsize=1)
+def _get_inert_species():
+    """
+    Return a tuple of the inert bath gas species (He, Ne, N2, and Ar). These
+    are only used for comparison, so they are created once on first use and
+    shared between calls.
+    """
+    return tuple(Species().from_smiles(inert) for inert in ('[He]', '[Ne]', 'N#N', '[Ar]'))
+
+
 def load_species_dictionary(path):
     """
     Load an RMG dictionary - containing species identifiers and the associated
@@ -808,7 +827,7 @@ def load_species_dictionary(path):
     """
     species_dict = {}
 
-    inerts = [Species().from_smiles(inert) for inert in ('[He]', '[Ne]', 'N#N', '[Ar]')]
+    inerts = _get_inert_species()
     with open(path, 'r') as f:
         adjlist = ''
         for line in f:
@@ -851,16 +870,14 @@ def remove_comment_from_line(line):
     Returns the line and the comment.
     If the comment is encoded with latin-1, it is converted to utf-8.
     """
-    try:
-        index1 = line.index('!')
-    except ValueError:
-        index1 = len(line)
-    try:
-        index2 = line.index('//')
-    except ValueError:
-        index2 = len(line)
+    index = len(line)
+    index1 = line.find('!')
+    if index1 != -1:
+        index = index1
+    index2 = line.find('//', 0, index)
+    if index2 != -1:
+        index = index2
 
-    index = min(index1, index2)
     comment = line[index + 1:-1]
     if index < len(line):
         line = line[0:index] + '\n'
@@ -1211,7 +1228,7 @@ def read_thermo_block(f, species_dict):
                 species_dict[label].thermo.comment = species_dict[label].thermo.comment.strip()
                 comments = ''
             except KeyError:
-                if label.upper() in ['AR', 'N2', 'HE', 'NE']:
+                if label.upper() in _INERT_LABELS:
                     logging.warning('Skipping species"{0}" while reading thermodynamics entry.'.format(label))
                 else:
                     logging.warning('Skipping unexpected species "{0}" while reading '
@@ -1223,6 +1240,23 @@ def read_thermo_block(f, species_dict):
     return formula_dict
 
 
+@functools.lru_cache(maxsize=16)
+def _get_rate_coefficient_units(volume_units, molecule_units, time_units):
+    """
+    Return a tuple of the units of the rate coefficient for zeroth- through
+    fourth-order reactions, given the homogenized volume, molecule, and time
+    units of a reactions block. The result is cached, since mechanisms
+    concatenated from several sources repeat the same unit section.
+    """
+    return (
+        '',  # Zeroth-order
+        '{0}^-1'.format(time_units),  # First-order
+        '{0}^3/({1}*{2})'.format(volume_units, molecule_units, time_units),  # Second-order
+        '{0}^6/({1}^2*{2})'.format(volume_units, molecule_units, time_units),  # Third-order
+        '{0}^9/({1}^3*{2})'.format(volume_units, molecule_units, time_units),  # Fourth-order
+    )
+
+
 def read_reactions_block(f, species_dict, read_comments=True):
     """
     Read a reactions block from a Chemkin file stream.
@@ -1306,13 +1340,7 @@ def read_reactions_block(f, species_dict, read_comments=True):
     energy_units = energy_units.replace('j/mol', 'J/mol')
 
     # Set up kinetics units
-    Aunits = [
-        '',  # Zeroth-order
-        's^-1'.format(time_units),  # First-order
-        '{0}^3/({1}*{2})'.format(volume_units, molecule_units, time_units),  # Second-order
-        '{0}^6/({1}^2*{2})'.format(volume_units, molecule_units, time_units),  # Third-order
-        '{0}^9/({1}^3*{2})'.format(volume_units, molecule_units, time_units),  # Fourth-order
-    ]
+    Aunits = _get_rate_coefficient_units(volume_units, molecule_units, time_units)
     Eunits = energy_units
 
     kinetics_list = []
@@ -1323,7 +1351,7 @@ def read_reactions_block(f, species_dict, read_comments=True):
     line = f.readline()
     while line != '':
 
-        line_starts_with_comment = line.lstrip().startswith('!') or line.lstrip().startswith('//')
+        line_starts_with_comment = line.lstrip().startswith(('!', '//'))
         line, comment = remove_comment_from_line(line)
         line = line.strip()
         comment = comment.strip()
@@ -1881,23 +1909,19 @@ def write_kinetics_entry(reaction, species_list, verbose=True, java_library=Fals
         string += '    CHEB/ {0:d} {1:d}/\n'.format(kinetics.degreeT, kinetics.degreeP)
         # rwest: bypassing the Units.get_conversion_factor_from_si_to_cm_mol_s() because it's in log10 space?
         if kinetics.degreeP < 6:
+            # One CHEB line per row of the coefficient matrix
             coeffs = kinetics.coeffs.value_si.copy()
             coeffs[0, 0] += 6 * (num_reactants - 1)
-            for i in range(kinetics.degreeT):
-                string += '    CHEB/'
-                for j in range(kinetics.degreeP):
-                    string += ' {0:<12.3e}'.format(coeffs[i, j])
-                string += '/\n'
+            rows = coeffs
         else:
-            coeffs = []
-            for i in range(kinetics.degreeT):
-                for j in range(kinetics.degreeP):
-                    coeffs.append(kinetics.coeffs.value_si[i, j])
+            # Five coefficients per CHEB line, flattened in row-major order
+            coeffs = kinetics.coeffs.value_si.flatten()
             coeffs[0] += 6 * (num_reactants - 1)
-            for i in range(len(coeffs)):
-                if i % 5 == 0: string += '    CHEB/'
-                string += ' {0:<12.3e}'.format(coeffs[i])
-                if i % 5 == 4: string += '/\n'
+            rows = [coeffs[i:i + 5] for i in range(0, len(coeffs), 5)]
+        for row in rows:
+            string += '    CHEB/' + ''.join([' {0:<12.3e}'.format(c) for c in row])
+            if kinetics.degreeP < 6 or len(row) == 5:
+                string += '/\n'
 
     if reaction.duplicate:
         string += 'DUPLICATE\n'
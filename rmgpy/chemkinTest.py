@@ -40,6 +40,7 @@ from rmgpy.data.kinetics import LibraryReaction
 from rmgpy.exceptions import ChemkinError
 from rmgpy.kinetics.arrhenius import Arrhenius, MultiArrhenius
 from rmgpy.kinetics.chebyshev import Chebyshev
+from rmgpy.kinetics.falloff import Troe
 from rmgpy.reaction import Reaction
 from rmgpy.species import Species
 from rmgpy.thermo import NASA, NASAPolynomial
@@ -314,6 +315,87 @@ class ChemkinTest(unittest.TestCase):
 
         self.assertEqual(reaction.specific_collider.label, 'N2(5)')
 
+    def test_read_troe_falloff_entry(self):
+        """
+        Test that a Chemkin reaction with LOW and TROE lines is read as Troe falloff kinetics
+        """
+        entry = """H+CH3(+M)<=>CH4(+M)                                 1.390e+16 -0.534     0.536
+    LOW / 2.620e+33 -4.760 2.440 /
+    TROE / 0.7830 74.00 2941.00 6964.00 /"""
+        species_dict = {
+            'H': Species(label='H').from_smiles('[H]'),
+            'CH3': Species(label='CH3').from_smiles('[CH3]'),
+            'CH4': Species(label='CH4').from_smiles('C'),
+        }
+        A_units = ['', 's^-1', 'cm^3/(mol*s)', 'cm^6/(mol^2*s)', 'cm^9/(mol^3*s)']
+        E_units = 'kcal/mol'
+        reaction = read_kinetics_entry(entry, species_dict, A_units, E_units)
+
+        self.assertTrue(isinstance(reaction.kinetics, Troe))
+        self.assertFalse(reaction.duplicate)
+        self.assertAlmostEqual(reaction.kinetics.arrheniusHigh.A.value / 1.390e+16, 1.0)
+        self.assertAlmostEqual(reaction.kinetics.arrheniusHigh.n.value, -0.534)
+        self.assertAlmostEqual(reaction.kinetics.arrheniusLow.A.value / 2.620e+33, 1.0)
+        self.assertAlmostEqual(reaction.kinetics.arrheniusLow.n.value, -4.760)
+        self.assertAlmostEqual(reaction.kinetics.arrheniusLow.Ea.value, 2.440)
+        self.assertAlmostEqual(reaction.kinetics.alpha, 0.7830)
+        self.assertAlmostEqual(reaction.kinetics.T3.value_si, 74.00)
+        self.assertAlmostEqual(reaction.kinetics.T1.value_si, 2941.00)
+        self.assertAlmostEqual(reaction.kinetics.T2.value_si, 6964.00)
+
+    def test_read_duplicate_entry(self):
+        """
+        Test that a DUPLICATE line marks the reaction as a duplicate without changing its kinetics
+        """
+        entry = """CH3+CH3<=>C2H6                                      9.500e+14 -1.000     0.000
+    DUPLICATE"""
+        species_dict = {
+            'CH3': Species(label='CH3').from_smiles('[CH3]'),
+            'C2H6': Species(label='C2H6').from_smiles('CC'),
+        }
+        A_units = ['', 's^-1', 'cm^3/(mol*s)', 'cm^6/(mol^2*s)', 'cm^9/(mol^3*s)']
+        E_units = 'kcal/mol'
+        reaction = read_kinetics_entry(entry, species_dict, A_units, E_units)
+
+        self.assertTrue(reaction.duplicate)
+        self.assertTrue(isinstance(reaction.kinetics, Arrhenius))
+        self.assertAlmostEqual(reaction.kinetics.A.value / 9.500e+14, 1.0)
+        self.assertAlmostEqual(reaction.kinetics.n.value, -1.000)
+
+    def test_read_efficiencies_with_keyword_like_species_names(self):
+        """
+        Test that collider names containing a kinetics keyword are read as efficiencies
+        rather than as that keyword
+        """
+        entry = """H+CH3(+M)<=>CH4(+M)                                 1.390e+16 -0.534     0.536
+    LOW / 2.620e+33 -4.760 2.440 /
+    TROE / 0.7830 74.00 2941.00 6964.00 /
+    DUPAR/0.700/ LOWHE/0.500/ TROEN2/1.200/ REVH2/2.000/"""
+        species_dict = {
+            'H': Species(label='H').from_smiles('[H]'),
+            'CH3': Species(label='CH3').from_smiles('[CH3]'),
+            'CH4': Species(label='CH4').from_smiles('C'),
+            'DUPAR': Species(label='DUPAR').from_smiles('[Ar]'),
+            'LOWHE': Species(label='LOWHE').from_smiles('[He]'),
+            'TROEN2': Species(label='TROEN2').from_smiles('N#N'),
+            'REVH2': Species(label='REVH2').from_smiles('[H][H]'),
+        }
+        A_units = ['', 's^-1', 'cm^3/(mol*s)', 'cm^6/(mol^2*s)', 'cm^9/(mol^3*s)']
+        E_units = 'kcal/mol'
+        reaction = read_kinetics_entry(entry, species_dict, A_units, E_units)
+
+        self.assertFalse(reaction.duplicate)
+        self.assertTrue(reaction.reversible)
+        self.assertTrue(isinstance(reaction.kinetics, Troe))
+        self.assertAlmostEqual(reaction.kinetics.arrheniusLow.A.value / 2.620e+33, 1.0)
+        self.assertAlmostEqual(reaction.kinetics.alpha, 0.7830)
+        efficiencies = reaction.kinetics.efficiencies
+        self.assertEqual(len(efficiencies), 4)
+        self.assertAlmostEqual(efficiencies[species_dict['DUPAR'].molecule[0]], 0.700)
+        self.assertAlmostEqual(efficiencies[species_dict['LOWHE'].molecule[0]], 0.500)
+        self.assertAlmostEqual(efficiencies[species_dict['TROEN2'].molecule[0]], 1.200)
+        self.assertAlmostEqual(efficiencies[species_dict['REVH2'].molecule[0]], 2.000)
+
     def test_process_duplicate_reactions(self):
         """
         Test that duplicate reactions are handled correctly when
@@ -34,6 +34,7 @@ components of the RMG database.
 """
 
 import codecs
+import functools
 import logging
 import os
 import re
@@ -45,6 +46,21 @@ from rmgpy.kinetics.uncertainties import RateUncertainty
 from rmgpy.molecule import Molecule, Group
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_species(adjlist, resonance):
+    """
+    Return the species for the adjacency list `adjlist`, with its resonance
+    structures if `resonance` is ``True``. Recently parsed species are cached,
+    since libraries and training sets repeat many of the same species, so the
+    returned object must not be modified.
+    """
+    from rmgpy.species import Species
+    species = Species().from_adjacency_list(adjlist)
+    if resonance:
+        species.generate_resonance_structures()
+    return species
+
+
 ################################################################################
 
 class Entry(object):
@@ -293,34 +309,31 @@ class Database(object):
         Load the dictionary containing all of the species in a kinetics library or depository.
         """
         from rmgpy.species import Species
+
+        def make_species(adjlist):
+            species = _parse_species(adjlist, resonance)
+            # Hand out new molecule objects so that changes made by the caller cannot alter the cached species
+            species = Species(label=species.label, molecule=[mol.copy(deep=True) for mol in species.molecule])
+            label = species.label
+            if label in species_dict:
+                raise DatabaseError('Species label "{0}" used for multiple species in {1}.'.format(label,
+                                                                                                   str(self)))
+            species_dict[label] = species
+
         species_dict = OrderedDict()
         with open(path, 'r') as f:
             adjlist = ''
             for line in f:
                 if line.strip() == '' and adjlist.strip() != '':
                     # Finish this adjacency list
-                    species = Species().from_adjacency_list(adjlist)
-                    if resonance:
-                        species.generate_resonance_structures()
-                    label = species.label
-                    if label in species_dict:
-                        raise DatabaseError('Species label "{0}" used for multiple species in {1}.'.format(label,
-                                                                                                           str(self)))
-                    species_dict[label] = species
+                    make_species(adjlist)
                     adjlist = ''
                 else:
                     adjlist += line
             else:  # reached end of file
                 if adjlist.strip() != '':
                     # Finish this adjacency list
-                    species = Species().from_adjacency_list(adjlist)
-                    if resonance:
-                        species.generate_resonance_structures()
-                    label = species.label
-                    if label in species_dict:
-                        raise DatabaseError('Species label "{0}" used for multiple species in {1}.'.format(label,
-                                                                                                           str(self)))
-                    species_dict[label] = species
+                    make_species(adjlist)
 
         return species_dict
 
@@ -1325,6 +1338,9 @@ class ForbiddenStructures(Database):
         """
         from rmgpy.species import Species
 
+        # The labeled atoms of the molecule are only needed for forbidden groups,
+        # so they are found on first use and then shared between entries
+        molecule_labeled_atoms = None
         for entry in self.entries.values():
             if isinstance(entry.item, Molecule) or isinstance(entry.item, Species):
                 # Perform an isomorphism check
@@ -1333,7 +1349,8 @@ class ForbiddenStructures(Database):
             elif isinstance(entry.item, Group):
                 # We need to do subgraph isomorphism
                 entry_labeled_atoms = entry.item.get_all_labeled_atoms()
-                molecule_labeled_atoms = molecule.get_all_labeled_atoms()
+                if molecule_labeled_atoms is None:
+                    molecule_labeled_atoms = molecule.get_all_labeled_atoms()
                 for label in entry_labeled_atoms:
                     # all group labels must be present in the molecule
                     if label not in molecule_labeled_atoms: break
@@ -27,6 +27,8 @@
 #                                                                             #
 ###############################################################################
 
+import os
+import tempfile
 import unittest
 
 from rmgpy.data.base import Entry, Database, ForbiddenStructures
@@ -92,6 +94,35 @@ class TestBaseDatabase(unittest.TestCase):
         # entry3 contains fewer labels than entry1, therefore it can be matched
         self.assertTrue(self.database.match_node_to_structure(entry1, entry3.item, atoms=entry3.item.get_all_labeled_atoms()))
 
+    def test_get_species_returns_independent_species(self):
+        """
+        Test that identical adjacency lists give equal but independent species.
+        """
+        adjlist = """CH3
+multiplicity 2
+1 C u1 p0 c0 {2,S} {3,S} {4,S}
+2 H u0 p0 c0 {1,S}
+3 H u0 p0 c0 {1,S}
+4 H u0 p0 c0 {1,S}
+
+"""
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write(adjlist)
+            path = f.name
+        try:
+            species1 = self.database.get_species(path)['CH3']
+            species2 = Database().get_species(path)['CH3']
+        finally:
+            os.remove(path)
+
+        self.assertIsNot(species1, species2)
+        self.assertTrue(species1.is_isomorphic(species2))
+        self.assertIsNot(species1.molecule[0], species2.molecule[0])
+
+        # Changing one species must not change the other
+        species1.molecule[0].atoms[0].label = '*1'
+        self.assertEqual(species2.molecule[0].atoms[0].label, '')
+
     def test_match_node_to_node(self):
         """
         Test that nodes can match other nodes.
@@ -49,6 +49,33 @@ def save_entry(f, entry):
     Save an `entry` in the kinetics database by writing a string to
     the given file object `f`.
     """
+    f.write(format_entry(entry))
+
+
+def save_entries(f, entries, chunk_size=1 << 20):
+    """
+    Save several `entries` in the kinetics database to the given file object
+    `f`. The formatted entries are collected and written out in chunks of
+    roughly `chunk_size` characters rather than one write per entry.
+    """
+    chunk = []
+    length = 0
+    for entry in entries:
+        text = format_entry(entry)
+        chunk.append(text)
+        length += len(text)
+        if length >= chunk_size:
+            f.write(''.join(chunk))
+            chunk = []
+            length = 0
+    if chunk:
+        f.write(''.join(chunk))
+
+
+def format_entry(entry):
+    """
+    Return the string used to save an `entry` in the kinetics database.
+    """
 
     def sort_efficiencies(efficiencies0):
         efficiencies = {}
@@ -57,17 +84,17 @@ def save_entry(f, entry):
                 # already in SMILES string format
                 smiles = mol
             else:
-                smiles = mol.to_smiles()
+                # Use the cached SMILES so that colliders shared by many
+                # entries are only converted once
+                smiles = mol.smiles
 
             efficiencies[smiles] = eff
-        keys = list(efficiencies.keys())
-        keys.sort()
-        return [(key, efficiencies[key]) for key in keys]
+        return {key: efficiencies[key] for key in sorted(efficiencies)}
 
-    f.write('entry(\n')
-    f.write('    index = {0:d},\n'.format(entry.index))
+    # Collect the text for the whole entry and write it out in one call
+    lines = ['entry(\n', '    index = {0:d},\n'.format(entry.index)]
     if entry.label != '':
-        f.write('    label = "{0}",\n'.format(entry.label))
+        lines.append('    label = "{0}",\n'.format(entry.label))
 
     # Entries for kinetic rules, libraries, training reactions
     # and depositories will have a Reaction object for its item
@@ -76,73 +103,68 @@ def save_entry(f, entry):
         # kinetic rules would have a Group object for its reactants instead of Species
         if isinstance(entry.item.reactants[0], Species):
             # Add degeneracy if the reaction is coming from a depository or kinetics library
-            f.write('    degeneracy = {0:.1f},\n'.format(entry.item.degeneracy))
+            lines.append('    degeneracy = {0:.1f},\n'.format(entry.item.degeneracy))
             if entry.item.duplicate:
-                f.write('    duplicate = {0!r},\n'.format(entry.item.duplicate))
+                lines.append('    duplicate = {0!r},\n'.format(entry.item.duplicate))
             if not entry.item.reversible:
-                f.write('    reversible = {0!r},\n'.format(entry.item.reversible))
+                lines.append('    reversible = {0!r},\n'.format(entry.item.reversible))
             if entry.item.allow_pdep_route:
-                f.write('    allow_pdep_route = {0!r},\n'.format(entry.item.allow_pdep_route))
+                lines.append('    allow_pdep_route = {0!r},\n'.format(entry.item.allow_pdep_route))
             if entry.item.elementary_high_p:
-                f.write('    elementary_high_p = {0!r},\n'.format(entry.item.elementary_high_p))
+                lines.append('    elementary_high_p = {0!r},\n'.format(entry.item.elementary_high_p))
             if entry.item.allow_max_rate_violation:
-                f.write('    allow_max_rate_violation = {0!r},\n'.format(entry.item.allow_max_rate_violation))
+                lines.append('    allow_max_rate_violation = {0!r},\n'.format(entry.item.allow_max_rate_violation))
     # Entries for groups with have a group or logicNode for its item
     elif isinstance(entry.item, Group):
-        f.write('    group = \n')
-        f.write('"""\n')
-        f.write(entry.item.to_adjacency_list())
-        f.write('""",\n')
+        lines.append('    group = \n"""\n{0}""",\n'.format(entry.item.to_adjacency_list()))
     elif isinstance(entry.item, LogicNode):
-        f.write('    group = "{0}",\n'.format(entry.item))
+        lines.append('    group = "{0}",\n'.format(entry.item))
     else:
         raise DatabaseError("Encountered unexpected item of type {0} while "
                             "saving database.".format(entry.item.__class__))
 
     # Write kinetics
     if isinstance(entry.data, str):
-        f.write('    kinetics = "{0}",\n'.format(entry.data))
+        lines.append('    kinetics = "{0}",\n'.format(entry.data))
     elif entry.data is not None:
         efficiencies = None
         if hasattr(entry.data, 'efficiencies'):
             efficiencies = entry.data.efficiencies
-            entry.data.efficiencies = dict(sort_efficiencies(entry.data.efficiencies))
+            entry.data.efficiencies = sort_efficiencies(entry.data.efficiencies)
         kinetics = repr(entry.data)  # todo prettify currently does not support uncertainty attribute
-        kinetics = '    kinetics = {0},\n'.format(kinetics.replace('\n', '\n    '))
-        f.write(kinetics)
+        lines.append('    kinetics = {0},\n'.format(kinetics.replace('\n', '\n    ')))
         if hasattr(entry.data, 'efficiencies'):
             entry.data.efficiencies = efficiencies
     else:
-        f.write('    kinetics = None,\n')
+        lines.append('    kinetics = None,\n')
 
     # Write reference
     if entry.reference is not None:
-        reference = entry.reference.to_pretty_repr()
-        lines = reference.splitlines()
-        f.write('    reference = {0}\n'.format(lines[0]))
-        for line in lines[1:-1]:
-            f.write('    {0}\n'.format(line))
-        f.write('    ),\n'.format(lines[0]))
+        reference = entry.reference.to_pretty_repr().splitlines()
+        lines.append('    reference = {0}\n'.format(reference[0]))
+        lines.extend('    {0}\n'.format(line) for line in reference[1:-1])
+        lines.append('    ),\n')
 
     if entry.reference_type != "":
-        f.write('    referenceType = "{0}",\n'.format(entry.reference_type))
+        lines.append('    referenceType = "{0}",\n'.format(entry.reference_type))
     if entry.rank is not None:
-        f.write('    rank = {0},\n'.format(entry.rank))
+        lines.append('    rank = {0},\n'.format(entry.rank))
 
     if entry.short_desc.strip() != '':
-        f.write(f'    shortDesc = """{entry.short_desc.strip()}""",\n')
+        lines.append(f'    shortDesc = """{entry.short_desc.strip()}""",\n')
     if entry.long_desc.strip() != '':
-        f.write(f'    longDesc = \n"""\n{entry.long_desc.strip()}\n""",\n')
+        lines.append(f'    longDesc = \n"""\n{entry.long_desc.strip()}\n""",\n')
 
     # write metal attributes
     if entry.metal:
-        f.write('    metal = "{0}",\n'.format(entry.metal))
+        lines.append('    metal = "{0}",\n'.format(entry.metal))
     if entry.facet:
-        f.write('    facet = "{0}",\n'.format(entry.facet))
+        lines.append('    facet = "{0}",\n'.format(entry.facet))
     if entry.site:
-        f.write('    site = "{0}",\n'.format(entry.site))
+        lines.append('    site = "{0}",\n'.format(entry.site))
 
-    f.write(')\n\n')
+    lines.append(')\n\n')
+    return ''.join(lines)
 
 
 def ensure_species(input_list, resonance=False, keep_isomorphic=False):
@@ -268,15 +290,21 @@ def find_degenerate_reactions(rxn_list, same_reactants=None, template=None, kine
 
     # We want to sort all the reactions into sublists composed of isomorphic reactions
     # with degenerate transition states
+    # Reactions can only be isomorphic if the fingerprints and multiplicities of their
+    # template products match, so the sublists are also bucketed by these and each reaction
+    # is only compared against the sublists in its own bucket
     sorted_rxns = []
+    sorted_rxns_by_key = {}
     for rxn0 in selected_rxns:
         rxn0.ensure_species()
-        if len(sorted_rxns) == 0:
+        bucket = sorted_rxns_by_key.setdefault(_get_template_products_key(rxn0), [])
+        if len(bucket) == 0:
             # This is the first reaction, so create a new sublist
             sorted_rxns.append([rxn0])
+            bucket.append(sorted_rxns[-1])
         else:
             # Loop through each sublist, which represents a unique reaction
-            for sub_list in sorted_rxns:
+            for sub_list in bucket:
                 # Try to determine if the current rxn0 is identical or isomorphic to any reactions in the sublist
                 isomorphic = False
                 identical = False
@@ -318,6 +346,7 @@ def find_degenerate_reactions(rxn_list, same_reactants=None, template=None, kine
             else:
                 # We did not break, which means that there was no isomorphic sublist, so create a new one
                 sorted_rxns.append([rxn0])
+                bucket.append(sorted_rxns[-1])
 
     rxn_list = []
     for sub_list in sorted_rxns:
@@ -343,6 +372,48 @@ def find_degenerate_reactions(rxn_list, same_reactants=None, template=None, kine
     return rxn_list
 
 
+def _get_template_products_key(reaction):
+    """
+    Return a sorted tuple of the (fingerprint, multiplicity) pairs of the
+    products of the template reaction `reaction`, in the direction of the
+    family template. The products are compared via their first molecules, which
+    must match in both of these to be isomorphic (even when ignoring electrons),
+    so reactions with different keys cannot be isomorphic. The fingerprint is
+    cached on each molecule, so the key is cheap to compute.
+    """
+    products = reaction.products if reaction.is_forward else reaction.reactants
+    return tuple(sorted((spc.molecule[0].fingerprint, spc.molecule[0].multiplicity) for spc in products))
+
+
+def get_fingerprint_key(species_list):
+    """
+    Return the sorted fingerprints of the species or molecules in
+    `species_list`, which are equal for any two isomorphic lists, or ``None``
+    if a species has no fingerprint.
+    """
+    fingerprints = [spc.fingerprint for spc in species_list]
+    if None in fingerprints:
+        return None
+    return tuple(sorted(fingerprints))
+
+
+def fingerprints_could_match(reaction, reactants_key, products_key=None):
+    """
+    Return ``False`` if `reaction` cannot be isomorphic, in either direction,
+    to a reaction whose reactants and products have the fingerprint keys
+    `reactants_key` and `products_key`, or ``True`` otherwise. Keys of ``None``
+    are not checked. This is a cheap filter to apply before isomorphism checks.
+    """
+    if reactants_key is None:
+        return True
+    keys = (get_fingerprint_key(reaction.reactants), get_fingerprint_key(reaction.products))
+    if None in keys:
+        return True
+    if products_key is None:
+        return reactants_key in keys
+    return keys == (reactants_key, products_key) or keys == (products_key, reactants_key)
+
+
 def reduce_same_reactant_degeneracy(reaction, same_reactants=None):
     """
     This method reduces the degeneracy of reactions with identical reactants,
@@ -31,13 +31,15 @@
 import logging
 import os.path
 from copy import deepcopy
+from multiprocessing import Pool
 
 import numpy as np
 
 import rmgpy.constants as constants
 from rmgpy.data.base import LogicNode
 from rmgpy.data.kinetics.common import ensure_species, generate_molecule_combos, \
-                                       find_degenerate_reactions, ensure_independent_atom_ids
+                                       find_degenerate_reactions, ensure_independent_atom_ids, \
+                                       get_fingerprint_key, fingerprints_could_match
 from rmgpy.data.kinetics.family import KineticsFamily
 from rmgpy.data.kinetics.library import LibraryReaction, KineticsLibrary
 from rmgpy.exceptions import DatabaseError
@@ -102,14 +104,15 @@ class KineticsDatabase(object):
         self.libraries = d['libraries']
         self.library_order = d['library_order']
 
-    def load(self, path, families=None, libraries=None, depositories=None):
+    def load(self, path, families=None, libraries=None, depositories=None, procnum=1):
         """
         Load the kinetics database from the given `path` on disk, where `path`
-        points to the top-level folder of the families database.
+        points to the top-level folder of the families database. The
+        libraries are parsed by `procnum` processes.
         """
         self.load_recommended_families(os.path.join(path, 'families', 'recommended.py')),
         self.load_families(os.path.join(path, 'families'), families, depositories)
-        self.load_libraries(os.path.join(path, 'libraries'), libraries)
+        self.load_libraries(os.path.join(path, 'libraries'), libraries, procnum=procnum)
 
     def load_recommended_families(self, filepath):
         """
@@ -218,23 +221,22 @@ class KineticsDatabase(object):
                 raise
             self.families[label] = family
 
-    def load_libraries(self, path, libraries=None):
+    def load_libraries(self, path, libraries=None, procnum=1):
         """
         Load the listed kinetics libraries from the given `path` on disk.
         
         Loads them all if `libraries` list is not specified or `None`.
         The `path` points to the folder of kinetics libraries in the database,
         and the libraries should be in files like :file:`<path>/<library>.py`.
+        If `procnum` is greater than one, the library files are parsed in
+        parallel by that many processes.
         """
-
+        library_files = []
         if libraries is not None:
             for library_name in libraries:
                 library_file = os.path.join(path, library_name, 'reactions.py')
                 if os.path.exists(library_file):
-                    logging.info('Loading kinetics library {0} from {1}...'.format(library_name, library_file))
-                    library = KineticsLibrary(label=library_name)
-                    library.load(library_file, self.local_context, self.global_context)
-                    self.libraries[library.label] = library
+                    library_files.append((library_name, library_file))
                 else:
                     if library_name == "KlippensteinH2O2":
                         logging.info("""\n** Note: The KlippensteinH2O2 library was replaced and is no longer available in RMG.
@@ -252,15 +254,20 @@ library instead, depending on the main bath gas (N2 or Ar/He, respectively)\n"""
                     if ext.lower() == '.py':
                         library_file = os.path.join(root, f)
                         label = os.path.dirname(library_file)[len(path) + 1:]
-                        logging.info('Loading kinetics library {0} from {1}...'.format(label, library_file))
-                        library = KineticsLibrary(label=label)
-                        try:
-                            library.load(library_file, self.local_context, self.global_context)
-                        except:
-                            logging.error("Problem loading reaction library {0!r}".format(library_file))
-                            raise
-                        self.libraries[library.label] = library
-                        self.library_order.append((library.label, 'Reaction Library'))
+                        library_files.append((label, library_file))
+
+        # The library files are independent of each other, so they can be parsed in parallel
+        if procnum > 1 and len(library_files) > 1:
+            with Pool(processes=min(procnum, len(library_files))) as pool:
+                loaded_libraries = pool.map(_load_kinetics_library, library_files)
+        else:
+            loaded_libraries = [_load_kinetics_library(args, self.local_context, self.global_context)
+                                for args in library_files]
+
+        for library in loaded_libraries:
+            self.libraries[library.label] = library
+            if libraries is None:
+                self.library_order.append((library.label, 'Reaction Library'))
 
     def save(self, path):
         """
@@ -434,12 +441,17 @@ and immediately used in input files without any additional changes.
         provided `reactants`, which can be either :class:`Molecule` objects or
         :class:`Species` objects.
         """
+        ensure_species(reactants)
+
+        # The fingerprint keys of the query are the same for every library, so find them once
+        reactants_key = get_fingerprint_key(reactants)
+        products_key = get_fingerprint_key(products) if products is not None else None
         reaction_list = []
         for label, library_type in self.library_order:
             # Generate reactions from reaction libraries (no need to generate them from seeds)
             if library_type == "Reaction Library":
-                reaction_list.extend(self.generate_reactions_from_library(self.libraries[label],
-                                                                          reactants, products=products))
+                reaction_list.extend(self._generate_reactions_from_library(self.libraries[label], reactants, products,
+                                                                           reactants_key, products_key))
         return reaction_list
 
     def generate_reactions_from_library(self, library, reactants, products=None):
@@ -450,8 +462,21 @@ and immediately used in input files without any additional changes.
         """
         ensure_species(reactants)
 
+        reactants_key = get_fingerprint_key(reactants)
+        products_key = get_fingerprint_key(products) if products is not None else None
+        return self._generate_reactions_from_library(library, reactants, products, reactants_key, products_key)
+
+    def _generate_reactions_from_library(self, library, reactants, products, reactants_key, products_key):
+        """
+        Find all reactions from the specified kinetics library involving the
+        provided :class:`Species` `reactants` and optional `products`, whose
+        fingerprint keys are `reactants_key` and `products_key`.
+        """
         reaction_list = []
         for entry in library.entries.values():
+            # Skip entries with different formulas without running the isomorphism checks in matches_species
+            if not fingerprints_could_match(entry.item, reactants_key, products_key):
+                continue
             if entry.item.matches_species(reactants, products=products):
                 reaction = LibraryReaction(
                     reactants=entry.item.reactants[:],
@@ -816,3 +841,23 @@ and immediately used in input files without any additional changes.
                 if isinstance(kinetics, (ArrheniusEP, ArrheniusBM)):
                     kinetics = kinetics.to_arrhenius(h298)
                 return kinetics
+
+
+def _load_kinetics_library(args, local_context=None, global_context=None):
+    """
+    Load and return the kinetics library for the given `(label, path)` tuple.
+    If no contexts are given, as when called from a process pool, those of
+    a fresh :class:`KineticsDatabase` are used.
+    """
+    label, library_file = args
+    if local_context is None:
+        database = KineticsDatabase()
+        local_context, global_context = database.local_context, database.global_context
+    logging.info('Loading kinetics library {0} from {1}...'.format(label, library_file))
+    library = KineticsLibrary(label=label)
+    try:
+        library.load(library_file, local_context, global_context)
+    except:
+        logging.error("Problem loading reaction library {0!r}".format(library_file))
+        raise
+    return library
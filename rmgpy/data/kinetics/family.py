@@ -31,6 +31,7 @@
 This module contains functionality for working with kinetics families.
 """
 import codecs
+import io
 import itertools
 import logging
 import multiprocessing as mp
@@ -42,13 +43,13 @@ from collections import OrderedDict
 from copy import deepcopy
 
 import numpy as np
-from sklearn.model_selection import KFold
 
 from rmgpy import settings
 from rmgpy.constraints import fails_species_constraints
-from rmgpy.data.base import Database, Entry, LogicNode, LogicOr, ForbiddenStructures, get_all_combinations
-from rmgpy.data.kinetics.common import save_entry, find_degenerate_reactions, generate_molecule_combos, \
-                                       ensure_independent_atom_ids
+from rmgpy.data.base import Database, Entry, LogicNode, LogicOr, ForbiddenStructures
+from rmgpy.data.kinetics.common import save_entry, save_entries, find_degenerate_reactions, \
+                                       generate_molecule_combos, ensure_independent_atom_ids, \
+                                       get_fingerprint_key, fingerprints_could_match
 from rmgpy.data.kinetics.depository import KineticsDepository
 from rmgpy.data.kinetics.groups import KineticsGroups
 from rmgpy.data.kinetics.rules import KineticsRules
@@ -62,6 +63,29 @@ from rmgpy.molecule.atomtype import ATOMTYPES
 from rmgpy.reaction import Reaction, same_species_lists
 from rmgpy.species import Species
 
+# Families that are their own reverse and whose product atoms are relabeled
+# in apply_recipe to match the reactant template
+_RELABELED_OWN_REVERSE_FAMILIES = frozenset([
+    'h_abstraction',
+    'intra_h_migration',
+    'intra_ene_reaction',
+    '6_membered_central_c-c_shift',
+    '1,2_shiftc',
+    'intra_r_add_exo_scission',
+    'intra_substitutions_isomerization',
+])
+
+# Families with charged substances, whose product groups need their charge updated
+_CHARGED_GROUP_FAMILIES = frozenset([
+    '1,2_insertion_co',
+    'r_addition_com',
+    'co_disproportionation',
+    'intra_no2_ono_conversion',
+    'lone_electron_pair_bond',
+    '1,2_nh3_elimination',
+    '1,3_nh3_elimination',
+])
+
 
 ################################################################################
 
@@ -225,8 +249,70 @@ class ReactionRecipe(object):
     action parameters as indicated above.
     """
 
+    # Integer opcodes for the recipe actions, ordered so that each action and
+    # its reverse occupy adjacent slots (see ``_REVERSE_OPCODES``)
+    CHANGE_BOND, FORM_BOND, BREAK_BOND, GAIN_RADICAL, LOSE_RADICAL, GAIN_PAIR, LOSE_PAIR = range(7)
+    _OPCODES = {
+        'CHANGE_BOND': CHANGE_BOND,
+        'FORM_BOND': FORM_BOND,
+        'BREAK_BOND': BREAK_BOND,
+        'GAIN_RADICAL': GAIN_RADICAL,
+        'LOSE_RADICAL': LOSE_RADICAL,
+        'GAIN_PAIR': GAIN_PAIR,
+        'LOSE_PAIR': LOSE_PAIR,
+    }
+    _ACTION_NAMES = tuple(sorted(_OPCODES, key=_OPCODES.get))
+    _REVERSE_OPCODES = (CHANGE_BOND, BREAK_BOND, FORM_BOND, LOSE_RADICAL, GAIN_RADICAL, LOSE_PAIR, GAIN_PAIR)
+
     def __init__(self, actions=None):
         self.actions = actions or []
+        self._compiled = [self._compile_action(action) for action in self.actions]
+        self._compiled_reverse = None
+
+    @classmethod
+    def _compile_action(cls, action):
+        """
+        Convert `action`, a list containing the action name and its parameters,
+        into an ``(opcode, label1, info, label2, args)`` tuple suitable for fast
+        dispatch in :meth:`_apply`. For radical and pair actions `info` is the
+        number of electrons or pairs and `label2` is ``None``.
+        """
+        try:
+            opcode = cls._OPCODES[action[0]]
+        except KeyError:
+            raise InvalidActionError('Unknown action "' + action[0] + '" encountered.')
+        if opcode <= cls.BREAK_BOND:
+            label1, info, label2 = action[1:]
+            if opcode == cls.CHANGE_BOND:
+                info = int(info)
+            return cls._make_step(opcode, label1, info, label2)
+        else:
+            label, change = action[1:]
+            return cls._make_step(opcode, label, int(change), None)
+
+    @classmethod
+    def _make_step(cls, opcode, label1, info, label2):
+        """
+        Return the compiled form of a single action, which carries the argument
+        list passed to the ``apply_action`` methods of the affected atoms and
+        bonds. The argument list is built once here and only ever read, so it
+        is shared by every application of the recipe.
+        """
+        if opcode <= cls.BREAK_BOND:
+            args = [cls._ACTION_NAMES[opcode], label1, info, label2]
+        else:
+            args = [cls._ACTION_NAMES[opcode], label1, info]
+        return opcode, label1, info, label2, args
+
+    @classmethod
+    def _reverse_step(cls, step):
+        """
+        Return the compiled action that undoes the compiled action `step`.
+        """
+        opcode, label1, info, label2, args = step
+        if opcode == cls.CHANGE_BOND:
+            info = -info
+        return cls._make_step(cls._REVERSE_OPCODES[opcode], label1, info, label2)
 
     def add_action(self, action):
         """
@@ -235,6 +321,8 @@ class ReactionRecipe(object):
         the table above.
         """
         self.actions.append(action)
+        self._compiled.append(self._compile_action(action))
+        self._compiled_reverse = None
 
     def get_reverse(self):
         """
@@ -242,24 +330,36 @@ class ReactionRecipe(object):
         what the current recipe does, i.e., it is the recipe for the reverse
         of the reaction that this is the recipe for.
         """
+        names, reverse_opcodes = self._ACTION_NAMES, self._REVERSE_OPCODES
+        program = self._get_program(True)
         other = ReactionRecipe()
-        for action in reversed(self.actions):  # Play the reverse recipe in the reverse order
-            if action[0] == 'CHANGE_BOND':
-                other.add_action(['CHANGE_BOND', action[1], str(-int(action[2])), action[3]])
-            elif action[0] == 'FORM_BOND':
-                other.add_action(['BREAK_BOND', action[1], action[2], action[3]])
-            elif action[0] == 'BREAK_BOND':
-                other.add_action(['FORM_BOND', action[1], action[2], action[3]])
-            elif action[0] == 'LOSE_RADICAL':
-                other.add_action(['GAIN_RADICAL', action[1], action[2]])
-            elif action[0] == 'GAIN_RADICAL':
-                other.add_action(['LOSE_RADICAL', action[1], action[2]])
-            elif action[0] == 'LOSE_PAIR':
-                other.add_action(['GAIN_PAIR', action[1], action[2]])
-            elif action[0] == 'GAIN_PAIR':
-                other.add_action(['LOSE_PAIR', action[1], action[2]])
+        # Play the reverse recipe in the reverse order
+        other.actions = [
+            ['CHANGE_BOND', action[1], str(-int(action[2])), action[3]] if opcode == self.CHANGE_BOND
+            else [names[reverse_opcodes[opcode]]] + action[1:]
+            for action, (opcode, _, _, _, _) in zip(reversed(self.actions), reversed(program))
+        ]
+        # The compiled form can be remapped directly instead of recompiling the new actions
+        other._compiled = [self._reverse_step(step) for step in reversed(program)]
         return other
 
+    def _get_program(self, forward):
+        """
+        Return the compiled actions to execute when applying the recipe in the
+        direction given by `forward`. The reverse program has its opcodes
+        swapped and its bond order changes negated ahead of time, so that
+        :meth:`_apply` does not need to consider the direction per action.
+        """
+        if len(self._compiled) != len(self.actions):
+            # The action list was modified directly rather than via add_action
+            self._compiled = [self._compile_action(action) for action in self.actions]
+            self._compiled_reverse = None
+        if forward:
+            return self._compiled
+        if self._compiled_reverse is None:
+            self._compiled_reverse = [self._reverse_step(step) for step in self._compiled]
+        return self._compiled_reverse
+
     def _apply(self, struct, forward, unique):
         """
         Apply the reaction recipe to the set of molecules contained in
@@ -272,22 +372,34 @@ class ReactionRecipe(object):
         pattern = isinstance(struct, Group)
         struct.props['validAromatic'] = True
 
-        for action in self.actions:
-            if action[0] in ['CHANGE_BOND', 'FORM_BOND', 'BREAK_BOND']:
+        # Atoms are never added or removed while applying a recipe, so index
+        # the labeled atoms once instead of scanning the structure per action
+        labeled_atoms = {}
+        for atom in struct.vertices:
+            if atom.label:
+                labeled_atoms.setdefault(atom.label, []).append(atom)
 
-                # We are about to change the connectivity of the atoms in
-                # struct, which invalidates any existing vertex connectivity
-                # information; thus we reset it
-                struct.reset_connectivity_values()
+        connectivity_reset = False
 
-                label1, info, label2 = action[1:]
+        for opcode, label1, info, label2, args in self._get_program(forward):
+            if opcode <= self.BREAK_BOND:
 
+                # We are about to change the connectivity of the atoms in
+                # struct, which invalidates any existing vertex connectivity
+                # information; thus we reset it (nothing recomputes it while
+                # the recipe is applied, so once is enough)
+                if not connectivity_reset:
+                    struct.reset_connectivity_values()
+                    connectivity_reset = True
+
+                # Find associated atoms (get_labeled_atoms raises the usual
+                # error if a label is missing)
+                atoms = labeled_atoms.get(label1) or struct.get_labeled_atoms(label1)
                 if label1 != label2:
-                    # Find associated atoms
-                    atom1 = struct.get_labeled_atoms(label1)[0]
-                    atom2 = struct.get_labeled_atoms(label2)[0]
+                    atom1 = atoms[0]
+                    atom2 = (labeled_atoms.get(label2) or struct.get_labeled_atoms(label2))[0]
                 else:
-                    atoms = struct.get_labeled_atoms(label1)  # should never have more than two if this action is valid
+                    # should never have more than two if this action is valid
                     if len(atoms) > 2:
                         raise InvalidActionError('Invalid atom labels encountered.')
                     atom1, atom2 = atoms
@@ -296,77 +408,53 @@ class ReactionRecipe(object):
                     raise InvalidActionError('Invalid atom labels encountered.')
 
                 # Apply the action
-                if action[0] == 'CHANGE_BOND':
-                    info = int(info)
+                if opcode == self.CHANGE_BOND:
                     bond = struct.get_bond(atom1, atom2)
                     if bond.is_benzene():
                         struct.props['validAromatic'] = False
-                    if forward:
-                        atom1.apply_action(['CHANGE_BOND', label1, info, label2])
-                        atom2.apply_action(['CHANGE_BOND', label1, info, label2])
-                        bond.apply_action(['CHANGE_BOND', label1, info, label2])
-                    else:
-                        atom1.apply_action(['CHANGE_BOND', label1, -info, label2])
-                        atom2.apply_action(['CHANGE_BOND', label1, -info, label2])
-                        bond.apply_action(['CHANGE_BOND', label1, -info, label2])
-                elif (action[0] == 'FORM_BOND' and forward) or (action[0] == 'BREAK_BOND' and not forward):
+                    atom1.apply_action(args)
+                    atom2.apply_action(args)
+                    bond.apply_action(args)
+                elif opcode == self.FORM_BOND:
                     if struct.has_bond(atom1, atom2):
                         raise InvalidActionError('Attempted to create an existing bond.')
                     if info not in (1, 0):  # Can only form single or vdW bonds
                         raise InvalidActionError('Attempted to create bond of type {:!r}'.format(info))
+                    # GroupBond keeps the order list it is given as its own `order`
+                    # attribute, so each new bond needs a fresh list; it cannot be
+                    # hoisted out of the loop or shared between applications
                     bond = GroupBond(atom1, atom2, order=[info]) if pattern else Bond(atom1, atom2, order=info)
                     struct.add_bond(bond)
-                    atom1.apply_action(['FORM_BOND', label1, info, label2])
-                    atom2.apply_action(['FORM_BOND', label1, info, label2])
-                elif (action[0] == 'BREAK_BOND' and forward) or (action[0] == 'FORM_BOND' and not forward):
+                    atom1.apply_action(args)
+                    atom2.apply_action(args)
+                else:
                     if not struct.has_bond(atom1, atom2):
                         raise InvalidActionError('Attempted to remove a nonexistent bond.')
                     bond = struct.get_bond(atom1, atom2)
                     struct.remove_bond(bond)
-                    atom1.apply_action(['BREAK_BOND', label1, info, label2])
-                    atom2.apply_action(['BREAK_BOND', label1, info, label2])
+                    atom1.apply_action(args)
+                    atom2.apply_action(args)
 
-            elif action[0] in ['LOSE_RADICAL', 'GAIN_RADICAL']:
-
-                label, change = action[1:]
-                change = int(change)
-
-                # Find associated atom
-                atoms = struct.get_labeled_atoms(label)
-                for atom in atoms:
-                    if atom is None:
-                        raise InvalidActionError('Unable to find atom with label "{0}" while applying '
-                                                 'reaction recipe.'.format(label))
-
-                    # Apply the action
-                    for i in range(change):
-                        if (action[0] == 'GAIN_RADICAL' and forward) or (action[0] == 'LOSE_RADICAL' and not forward):
-                            atom.apply_action(['GAIN_RADICAL', label, 1])
-                        elif (action[0] == 'LOSE_RADICAL' and forward) or (action[0] == 'GAIN_RADICAL' and not forward):
-                            atom.apply_action(['LOSE_RADICAL', label, 1])
-
-            elif action[0] in ['LOSE_PAIR', 'GAIN_PAIR']:
-
-                label, change = action[1:]
-                change = int(change)
+            else:
 
                 # Find associated atom
-                atoms = struct.get_labeled_atoms(label)
+                atoms = labeled_atoms.get(label1) or struct.get_labeled_atoms(label1)
 
+                # Molecule atoms apply the whole change at once, but group atoms
+                # must be stepped one electron (pair) at a time since each step
+                # also updates the allowed atom types
+                if pattern:
+                    args, repeat = [args[0], label1, 1], info
+                else:
+                    repeat = 1
                 for atom in atoms:
                     if atom is None:
                         raise InvalidActionError('Unable to find atom with label "{0}" while applying '
-                                                 'reaction recipe.'.format(label))
+                                                 'reaction recipe.'.format(label1))
 
                     # Apply the action
-                    for i in range(change):
-                        if (action[0] == 'GAIN_PAIR' and forward) or (action[0] == 'LOSE_PAIR' and not forward):
-                            atom.apply_action(['GAIN_PAIR', label, 1])
-                        elif (action[0] == 'LOSE_PAIR' and forward) or (action[0] == 'GAIN_PAIR' and not forward):
-                            atom.apply_action(['LOSE_PAIR', label, 1])
-
-            else:
-                raise InvalidActionError('Unknown action "' + action[0] + '" encountered.')
+                    for i in range(repeat):
+                        atom.apply_action(args)
 
     def apply_forward(self, struct, unique=True):
         """
@@ -453,6 +541,10 @@ class KineticsFamily(Database):
         self.rules = None
         self.depositories = []
 
+        # Cache of the group structures below the logic nodes in the template,
+        # keyed by the logic node; reset whenever the groups are replaced
+        self._possible_structures = {}
+
     def __repr__(self):
         return '<ReactionFamily "{0}">'.format(self.label)
 
@@ -468,6 +560,7 @@ class KineticsFamily(Database):
 
         self.groups = KineticsGroups(label='{0}/groups'.format(self.label))
         self.groups.name = self.groups.label
+        self._possible_structures = {}
         try:
             self.groups.load_old_dictionary(os.path.join(path, 'dictionary.txt'), pattern=True)
         except Exception:
@@ -536,38 +629,33 @@ class KineticsFamily(Database):
         self.forward_recipe = ReactionRecipe()
         self.own_reverse = False
 
-        ftemp = None
         # Process the template file
         try:
-            ftemp = open(path, 'r')
-            for line in ftemp:
-                line = line.strip()
-                if len(line) > 0 and line[0] == '(':
-                    # This is a recipe action line
-                    tokens = line.split()
-                    action = [tokens[1]]
-                    action.extend(tokens[2][1:-1].split(','))
-                    self.forward_recipe.add_action(action)
-                elif 'thermo_consistence' in line:
-                    self.own_reverse = True
-                elif 'reverse' in line:
-                    self.reverse = line.split(':')[1].strip()
-                elif '->' in line:
-                    # This is the template line
-                    tokens = line.split()
-                    at_arrow = False
-                    for token in tokens:
-                        if token == '->':
-                            at_arrow = True
-                        elif token != '+' and not at_arrow:
-                            self.forward_template.reactants.append(token)
-                        elif token != '+' and at_arrow:
-                            self.forward_template.products.append(token)
+            with open(path, 'r') as ftemp:
+                lines = ftemp.read().splitlines()
         except IOError as e:
             logging.exception('Database template file "' + e.filename + '" not found.')
             raise
-        finally:
-            if ftemp: ftemp.close()
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            if line[0] == '(':
+                # This is a recipe action line
+                tokens = line.split()
+                action = [tokens[1]]
+                action.extend(tokens[2][1:-1].split(','))
+                self.forward_recipe.add_action(action)
+            elif 'thermo_consistence' in line:
+                self.own_reverse = True
+            elif 'reverse' in line:
+                self.reverse = line.split(':')[1].strip()
+            elif '->' in line:
+                # This is the template line
+                tokens = line.split()
+                arrow = tokens.index('->') if '->' in tokens else len(tokens)
+                self.forward_template.reactants.extend(token for token in tokens[:arrow] if token != '+')
+                self.forward_template.products.extend(token for token in tokens[arrow + 1:] if token not in ('+', '->'))
 
     def save_old(self, path):
         """
@@ -632,7 +720,7 @@ class KineticsFamily(Database):
             raise ValueError('tree_distances does not have the same number of '
                              'entries as there are top nodes in the family')
 
-        for entry_name, entry in self.groups.entries.items():
+        for entry in self.groups.entries.values():
             top_entry = entry
             while not (top_entry.parent is None):  # get the top for the tree entry is in
                 top_entry = top_entry.parent
@@ -665,6 +753,7 @@ class KineticsFamily(Database):
         local_context['productNum'] = None
         local_context['autoGenerated'] = False
         self.groups = KineticsGroups(label='{0}/groups'.format(self.label))
+        self._possible_structures = {}
         logging.debug("Loading kinetics family groups from {0}".format(os.path.join(path, 'groups.py')))
         Database.load(self.groups, os.path.join(path, 'groups.py'), local_context, global_context)
         self.name = self.label
@@ -776,14 +865,14 @@ class KineticsFamily(Database):
         """
         # Remaining lines are reaction recipe for forward reaction
         self.forward_recipe = ReactionRecipe()
+        # The action names are validated against the recipe opcode table, and
+        # add_action compiles each action to its integer opcode for _apply
+        valid_actions = ReactionRecipe._OPCODES
         for action in actions:
             action[0] = action[0].upper()
-            valid_actions = [
-                'CHANGE_BOND', 'FORM_BOND', 'BREAK_BOND', 'GAIN_RADICAL', 'LOSE_RADICAL', 'GAIN_PAIR', 'LOSE_PAIR'
-            ]
             if action[0] not in valid_actions:
                 raise InvalidActionError('Action {0} is not a recognized action. '
-                                         'Should be one of {1}'.format(actions[0], valid_actions))
+                                         'Should be one of {1}'.format(action[0], list(ReactionRecipe._ACTION_NAMES)))
             self.forward_recipe.add_action(action)
 
     def load_forbidden(self, label, group, shortDesc='', longDesc=''):
@@ -930,8 +1019,10 @@ class KineticsFamily(Database):
         """
         entries = self.groups.get_entries_to_save()
 
+        # The file is assembled in memory and written out in a single call
+        f = io.StringIO()
+
         # Write the header
-        f = codecs.open(path, 'w', 'utf-8')
         f.write('#!/usr/bin/env python\n')
         f.write('# encoding: utf-8\n\n')
         f.write('name = "{0}/groups"\n'.format(self.name))
@@ -968,8 +1059,7 @@ class KineticsFamily(Database):
 
         # Write the recipe
         f.write('recipe(actions=[\n')
-        for action in self.forward_recipe.actions:
-            f.write('    {0!r},\n'.format(action))
+        f.write(''.join('    {0!r},\n'.format(action) for action in self.forward_recipe.actions))
         f.write('])\n\n')
 
         if self.boundary_atoms:
@@ -977,8 +1067,7 @@ class KineticsFamily(Database):
             f.write('\n\n')
 
         # Save the entries
-        for entry in entries:
-            self.save_entry(f, entry)
+        save_entries(f, entries)
 
         # Write the tree
         if len(self.groups.top) > 0:
@@ -995,7 +1084,8 @@ class KineticsFamily(Database):
             for entry in entries:
                 self.forbidden.save_entry(f, entry, name='forbidden')
 
-        f.close()
+        with codecs.open(path, 'w', 'utf-8') as f_out:
+            f_out.write(f.getvalue())
 
     def generate_product_template(self, reactants0):
         """
@@ -1021,23 +1111,28 @@ class KineticsFamily(Database):
                 else:
                     reactant_structures.append([struct])
 
-        # Second, get all possible combinations of reactant structures
-        reactant_structures = get_all_combinations(reactant_structures)
-
-        # Third, generate all possible product structures by applying the
-        # recipe to each combination of reactant structures
+        # Second, generate all possible product structures by applying the
+        # recipe to each combination of reactant structures, and remove
+        # duplicates as we go so that only unique products are kept
         # Note that bimolecular products are split by labeled atoms
-        product_structures = []
-        for reactant_structure in reactant_structures:
-            product_structure = self.apply_recipe(reactant_structure, forward=True, unique=False)
-            if product_structure:
-                product_structures.append(product_structure)
-
-        # Fourth, remove duplicates from the lists
-        product_structure_list = [[] for i in range(len(product_structures[0]))]
-        for product_structure in product_structures:
+        # Identical groups must have the same numbers of atoms and bonds, so
+        # bucket the unique structures by these counts and only check for
+        # identity within a bucket
+        # The combinations are iterated in the same order as returned by
+        # get_all_combinations, i.e. with the first reactant varying fastest
+        product_structure_list = []
+        product_structure_buckets = []
+        for combination in itertools.product(*reversed(reactant_structures)):
+            product_structure = self.apply_recipe(list(reversed(combination)), forward=True, unique=False)
+            if not product_structure:
+                continue
+            if not product_structure_list:
+                product_structure_list = [[] for i in range(len(product_structure))]
+                product_structure_buckets = [{} for i in range(len(product_structure))]
             for i, struct in enumerate(product_structure):
-                for s in product_structure_list[i]:
+                key = (len(struct.atoms), sum(len(atom.edges) for atom in struct.atoms))
+                bucket = product_structure_buckets[i].setdefault(key, [])
+                for s in bucket:
                     try:
                         if s.is_identical(struct): break
                     except KeyError:
@@ -1045,9 +1140,19 @@ class KineticsFamily(Database):
                         logging.error(s.to_adjacency_list())
                         raise
                 else:
+                    bucket.append(struct)
                     product_structure_list[i].append(struct)
-        # Fifth, associate structures with product template
+
+        if not product_structure_list:
+            reactant_labels = [reactant[0].label if isinstance(reactant, list) else reactant.label
+                               for reactant in reactants0]
+            raise DatabaseError('Could not generate product template for reactants {0} in family '
+                                '{1}.'.format(reactant_labels, self.label))
+
+        # Third, associate structures with product template
+        # The new entries are collected locally and added to the groups at once
         product_set = []
+        new_entries = {}
         for index, products in enumerate(product_structure_list):
             label = self.forward_template.products[index]
             if len(products) == 1:
@@ -1055,19 +1160,17 @@ class KineticsFamily(Database):
                     label=label,
                     item=products[0],
                 )
-                self.groups.entries[entry.label] = entry
+                new_entries[entry.label] = entry
                 product_set.append(entry)
             else:
                 children = []
-                counter = 0
-                for product in products:
+                for counter, product in enumerate(products, 1):
                     entry = Entry(
-                        label='{0}{1:d}'.format(label, counter + 1),
+                        label='{0}{1:d}'.format(label, counter),
                         item=product,
                     )
                     children.append(entry)
-                    self.groups.entries[entry.label] = entry
-                    counter += 1
+                    new_entries[entry.label] = entry
 
                 # Enter the parent of the groups as a logicOr of all the products
                 entry = Entry(
@@ -1075,12 +1178,12 @@ class KineticsFamily(Database):
                     item=LogicOr([child.label for child in children], invert=False),
                     children=children,
                 )
-                self.groups.entries[entry.label] = entry
+                new_entries[entry.label] = entry
                 # Make this entry the parent of all its children
                 for child in children:
                     child.parent = entry
-                counter += 1
                 product_set.append(entry)
+        self.groups.entries.update(new_entries)
 
         return product_set
 
@@ -1310,12 +1413,16 @@ class KineticsFamily(Database):
         # Also copy structures so we don't modify the originals
         # Since the tagging has already occurred, both the reactants and the
         # products will have tags
+        # The atoms of all the copies are collected and wrapped in a single
+        # structure, rather than merging one reactant at a time, to avoid
+        # creating (and for groups, updating) an intermediate structure per reactant
+        atoms = []
+        for s in reactant_structures:
+            atoms.extend(s.copy(deep=True).atoms)
         if isinstance(reactant_structures[0], Group):
-            reactant_structure = Group()
+            reactant_structure = Group(atoms=atoms)
         else:
-            reactant_structure = Molecule()
-        for s in reactant_structures:
-            reactant_structure = reactant_structure.merge(s.copy(deep=True))
+            reactant_structure = Molecule(atoms=atoms)
 
         if forward:
             # Hardcoding of reaction family for peroxyl disproportionation
@@ -1419,8 +1526,9 @@ class KineticsFamily(Database):
         # This allows comparison of the product species to forbidden
         #  structures which are labeled as reactants.
         # Unfortunately, this means that reaction family info is
-        #  hardcoded, so this must be updated if the database changes.
-        if not self.reverse_template:
+        #  hardcoded, so this (and _RELABELED_OWN_REVERSE_FAMILIES) must be
+        #  updated if the database changes.
+        if not self.reverse_template and label in _RELABELED_OWN_REVERSE_FAMILIES:
             # Get atom labels for products
             atom_labels = {}
             for atom in product_structure.atoms:
@@ -1446,8 +1554,10 @@ class KineticsFamily(Database):
                     atom_labels['*5'].label = '*4'
                 if highest > 6:
                     # swap *6 with the highest, etc.
-                    for i in range(6, highest + 1):
-                        atom_labels['*{0:d}'.format(i)].label = '*{0:d}'.format(6 + highest - i)
+                    chain_labels = ['*{0:d}'.format(i) for i in range(6, highest + 1)]
+                    chain_atoms = [atom_labels[chain_label] for chain_label in chain_labels]
+                    for atom, chain_label in zip(chain_atoms, reversed(chain_labels)):
+                        atom.label = chain_label
 
             elif label == 'intra_ene_reaction':
                 # Labels for nodes are swapped
@@ -1522,9 +1632,7 @@ class KineticsFamily(Database):
                 struct.update(sort_atoms=not self.save_order)
             elif isinstance(struct, Group):
                 struct.reset_ring_membership()
-                if label in ['1,2_insertion_co', 'r_addition_com', 'co_disproportionation',
-                             'intra_no2_ono_conversion', 'lone_electron_pair_bond',
-                             '1,2_nh3_elimination', '1,3_nh3_elimination']:
+                if label in _CHARGED_GROUP_FAMILIES:
                     struct.update_charge()
             else:
                 raise TypeError('Expecting Molecule or Group object, not {0}'.format(struct.__class__.__name__))
@@ -1552,11 +1660,18 @@ class KineticsFamily(Database):
         elif len(product_structures) == 3:
             lowest_labels = []
             for struct in product_structures:
-                # Extract digits from labels and convert others (e.g., "*") to empty strings
-                labels = [''.join(c for c in label if c.isdigit()) for label in struct.get_all_labeled_atoms().keys()]
-                # Convert digits to integers and remove empty strings
-                labels = [int(label) for label in labels if label]
-                lowest_labels.append(min(labels))
+                # Find the lowest number among the atom labels in a single pass,
+                # ignoring the non-digit characters (e.g., "*") and unlabeled atoms
+                lowest_label = None
+                for atom in struct.atoms:
+                    if not atom.label:
+                        continue
+                    digits = ''.join(c for c in atom.label if c.isdigit())
+                    if digits and (lowest_label is None or int(digits) < lowest_label):
+                        lowest_label = int(digits)
+                if lowest_label is None:
+                    raise ValueError('Product structure has no numbered atom labels: {0}'.format(struct))
+                lowest_labels.append(lowest_label)
             product_structures = [s for _, s in sorted(zip(lowest_labels, product_structures))]
 
         # Return the product structures
@@ -1656,6 +1771,19 @@ class KineticsFamily(Database):
 
         return reaction
 
+    def _get_possible_structures(self, node):
+        """
+        Return a tuple of the group structures below the logic node `node` in
+        the groups of this family. The expansion is cached, since the same
+        template is matched against every reactant.
+        """
+        try:
+            return self._possible_structures[node]
+        except KeyError:
+            structures = tuple(node.get_possible_structures(self.groups.entries))
+            self._possible_structures[node] = structures
+            return structures
+
     def _match_reactant_to_template(self, reactant, template_reactant):
         """
         Return a complete list of the mappings if the provided reactant 
@@ -1673,7 +1801,7 @@ class KineticsFamily(Database):
 
         if isinstance(struct, LogicNode):
             mappings = []
-            for child_structure in struct.get_possible_structures(self.groups.entries):
+            for child_structure in self._get_possible_structures(struct):
                 if child_structure.contains_surface_site() != reactant_contains_surface_site:
                     # An adsorbed template can't match a gas-phase species and vice versa
                     continue
@@ -1978,53 +2106,57 @@ class KineticsFamily(Database):
                         # Both reactants either contain or are a surface site.
                         return []
 
+            # The matches of a resonance isomer to a template reactant do not depend on the other reactant,
+            # so each one is found once and reused for every pairing of resonance isomers. The molecules are
+            # held by `reactants` for the duration of this call, so their ids are stable keys.
+            matches = {}
+
+            def match_reactant_to_template(molecule, index):
+                key = (id(molecule), index)
+                if key not in matches:
+                    matches[key] = self._match_reactant_to_template(molecule, template_reactants[index])
+                return matches[key]
+
+            def react_with_template_order(molecule_a, molecule_b, index_a, index_b):
+                """
+                Generate reactions with `molecule_a` matched to template reactant `index_a`
+                and `molecule_b` matched to template reactant `index_b`.
+                """
+                mappings_a = match_reactant_to_template(molecule_a, index_a)
+                mappings_b = match_reactant_to_template(molecule_b, index_b)
+
+                # Iterate over each pair of matches (A, B)
+                for map_a in mappings_a:
+                    for map_b in mappings_b:
+                        # Reverse the order of reactants in case we have a family with only one reactant tree
+                        # that can produce different products depending on the order of reactants
+                        if index_a == 0:
+                            reactant_structures, maps = [molecule_b, molecule_a], [map_b, map_a]
+                        else:
+                            reactant_structures, maps = [molecule_a, molecule_b], [map_a, map_b]
+                        try:
+                            product_structures = self._generate_product_structures(reactant_structures, maps, forward)
+                        except ForbiddenStructureException:
+                            pass
+                        else:
+                            if product_structures is not None:
+                                rxn = self._create_reaction(reactant_structures, product_structures, forward)
+                                if rxn:
+                                    rxn_list.append(rxn)
+
             # Iterate over all resonance isomers of the reactant
             for molecule_a in molecules_a:
                 for molecule_b in molecules_b:
                     if (molecule_a.reactive and molecule_b.reactive) or react_non_reactive:
-
                         # Reactants stored as A + B
-                        mappings_a = self._match_reactant_to_template(molecule_a, template_reactants[0])
-                        mappings_b = self._match_reactant_to_template(molecule_b, template_reactants[1])
-
-                        # Iterate over each pair of matches (A, B)
-                        for map_a in mappings_a:
-                            for map_b in mappings_b:
-                                # Reverse the order of reactants in case we have a family with only one reactant tree
-                                # that can produce different products depending on the order of reactants
-                                reactant_structures = [molecule_b, molecule_a]
-                                try:
-                                    product_structures = self._generate_product_structures(reactant_structures,
-                                                                                           [map_b, map_a], forward)
-                                except ForbiddenStructureException:
-                                    pass
-                                else:
-                                    if product_structures is not None:
-                                        rxn = self._create_reaction(reactant_structures, product_structures, forward)
-                                        if rxn: rxn_list.append(rxn)
+                        react_with_template_order(molecule_a, molecule_b, 0, 1)
 
                         # Only check for swapped reactants if they are different
+                        # Identical template reactants are not skipped, since the hardcoded relabeling in
+                        # apply_recipe depends on the order of the reactant structures
                         if reactants[0] is not reactants[1]:
-
                             # Reactants stored as B + A
-                            mappings_a = self._match_reactant_to_template(molecule_a, template_reactants[1])
-                            mappings_b = self._match_reactant_to_template(molecule_b, template_reactants[0])
-
-                            # Iterate over each pair of matches (A, B)
-                            for map_a in mappings_a:
-                                for map_b in mappings_b:
-                                    reactant_structures = [molecule_a, molecule_b]
-                                    try:
-                                        product_structures = self._generate_product_structures(reactant_structures,
-                                                                                               [map_a, map_b], forward)
-                                    except ForbiddenStructureException:
-                                        pass
-                                    else:
-                                        if product_structures is not None:
-                                            rxn = self._create_reaction(reactant_structures, product_structures,
-                                                                        forward)
-                                            if rxn:
-                                                rxn_list.append(rxn)
+                            react_with_template_order(molecule_a, molecule_b, 1, 0)
 
         # Termolecular reactants: A + B + C --> products
         elif len(reactants) == 2 and len(template_reactants) == 3:
@@ -2282,6 +2414,7 @@ class KineticsFamily(Database):
         as the reactants, return the reactant-product pairs to use when
         performing flux analysis.
         """
+        label = self.label.lower()
         pairs = []
         if len(reaction.reactants) == 1 or len(reaction.products) == 1:
             # When there is only one reactant (or one product), it is paired 
@@ -2289,7 +2422,7 @@ class KineticsFamily(Database):
             for reactant in reaction.reactants:
                 for product in reaction.products:
                     pairs.append([reactant, product])
-        elif self.label.lower() == 'h_abstraction':
+        elif label == 'h_abstraction':
             # Hardcoding for hydrogen abstraction: pair the reactant containing
             # *1 with the product containing *3 and vice versa
             assert len(reaction.reactants) == len(reaction.products) == 2
@@ -2307,7 +2440,7 @@ class KineticsFamily(Database):
                 elif reaction.products[0].contains_labeled_atom('*3'):
                     pairs.append([reaction.reactants[0], reaction.products[1]])
                     pairs.append([reaction.reactants[1], reaction.products[0]])
-        elif self.label.lower() in ['disproportionation', 'co_disproportionation', 'korcek_step1_cat']:
+        elif label in ['disproportionation', 'co_disproportionation', 'korcek_step1_cat']:
             # Hardcoding for disproportionation, co_disproportionation, korcek_step1_cat:
             # pair the reactant containing *1 with the product containing *1
             assert len(reaction.reactants) == len(reaction.products) == 2
@@ -2325,7 +2458,7 @@ class KineticsFamily(Database):
                 elif reaction.products[0].contains_labeled_atom('*1'):
                     pairs.append([reaction.reactants[0], reaction.products[1]])
                     pairs.append([reaction.reactants[1], reaction.products[0]])
-        elif self.label.lower() in ['substitution_o', 'substitutions']:
+        elif label in ['substitution_o', 'substitutions']:
             # Hardcoding for Substitution_O: pair the reactant containing
             # *2 with the product containing *3 and vice versa
             assert len(reaction.reactants) == len(reaction.products) == 2
@@ -2343,7 +2476,7 @@ class KineticsFamily(Database):
                 elif reaction.products[0].contains_labeled_atom('*3'):
                     pairs.append([reaction.reactants[0], reaction.products[1]])
                     pairs.append([reaction.reactants[1], reaction.products[0]])
-        elif self.label.lower() == 'baeyer-villiger_step1_cat':
+        elif label == 'baeyer-villiger_step1_cat':
             # Hardcoding for Baeyer-Villiger_step1_cat: pair the two reactants
             # with the Criegee intermediate and pair the catalyst with itself
             assert len(reaction.reactants) == 3 and len(reaction.products) == 2
@@ -2374,7 +2507,7 @@ class KineticsFamily(Database):
                     pairs.append([reaction.reactants[0], reaction.products[1]])
                     pairs.append([reaction.reactants[1], reaction.products[1]])
                     pairs.append([reaction.reactants[2], reaction.products[0]])
-        elif self.label.lower() == 'baeyer-villiger_step2_cat':
+        elif label == 'baeyer-villiger_step2_cat':
             # Hardcoding for Baeyer-Villiger_step2_cat: pair the Criegee
             # intermediate with the two products and the catalyst with itself
             assert len(reaction.reactants) == 2 and len(reaction.products) == 3
@@ -2415,7 +2548,7 @@ class KineticsFamily(Database):
                 for reactant in reactants:
                     for product in products:
                         pairs.append([reactant, product])
-            elif self.label.lower() == 'surface_abstraction':
+            elif label == 'surface_abstraction':
                 # Hardcoding for surface abstraction: pair the reactant containing
                 # *1 with the product containing *3 and vice versa
                 assert len(reaction.reactants) == len(reaction.products) == 2
@@ -2477,8 +2610,13 @@ class KineticsFamily(Database):
         direction.
         """
         kinetics_list = []
+        reactants_key = get_fingerprint_key(reaction.reactants)
+        products_key = get_fingerprint_key(reaction.products)
         entries = depository.entries.values()
         for entry in entries:
+            # Skip entries with different formulas without running the isomorphism checks
+            if not fingerprints_could_match(entry.item, reactants_key, products_key):
+                continue
             if entry.item.is_isomorphic(reaction):
                 kinetics_list.append(
                     [deepcopy(entry.data), entry, entry.item.is_isomorphic(reaction, either_direction=False)])
@@ -3403,7 +3541,7 @@ class KineticsFamily(Database):
         inds = np.arange(len(inputs))
         np.random.shuffle(inds)  # want to parallelize in random order
         inds = inds.tolist()
-        revinds = [inds.index(x) for x in np.arange(len(inputs))]
+        revinds = np.argsort(inds)  # inverse permutation, i.e. the position of each entry in inds
 
         pool = mp.Pool(nprocs)
 
@@ -3449,6 +3587,7 @@ class KineticsFamily(Database):
             if folds == 0:
                 folds = len(rxns)
 
+            from sklearn.model_selection import KFold
             kf = KFold(folds, shuffle=True, random_state=random_state)
             kfsplits = kf.split(rxns)
         else:
@@ -3513,6 +3652,7 @@ class KineticsFamily(Database):
         if folds == 0:
             folds = len(rxns)
 
+        from sklearn.model_selection import KFold
         kf = KFold(folds, shuffle=True, random_state=random_state)
 
         if thermo_database is None:
@@ -3755,6 +3895,7 @@ class KineticsFamily(Database):
 
         # clear everything
         self.groups.entries = {x.label: x for x in self.groups.entries.values() if x.index == -1}
+        self._possible_structures = {}
 
         # add the starting node
         self.add_entry(None, grp, 'Root')
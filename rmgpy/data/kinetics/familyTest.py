@@ -38,8 +38,9 @@ import numpy as np
 
 from rmgpy import settings
 from rmgpy.data.kinetics.database import KineticsDatabase
-from rmgpy.data.kinetics.family import TemplateReaction
+from rmgpy.data.kinetics.family import ReactionRecipe, TemplateReaction
 from rmgpy.data.rmg import RMGDatabase
+from rmgpy.exceptions import DatabaseError
 from rmgpy.data.thermo import ThermoDatabase
 from rmgpy.molecule import Molecule
 from rmgpy.species import Species
@@ -100,6 +101,15 @@ class TestFamily(unittest.TestCase):
         self.assertIn(self.family.groups.entries["R2Hall"], top_groups)
         self.assertIn(self.family.groups.entries["R3Hall"], top_groups)
 
+    def test_generate_product_template_without_products(self):
+        """
+        Test that generate_product_template() raises an error if no reactant structures give products
+        """
+        reactants = self.family.forward_template.reactants
+        with mock.patch.object(self.family, 'apply_recipe', return_value=None):
+            with self.assertRaises(DatabaseError):
+                self.family.generate_product_template(reactants)
+
     def test_react_benzene_bond(self):
         """
         Test that hydrogen addition to benzene (w/ benzene bonds) returns kekulized product.
@@ -656,6 +666,46 @@ multiplicity 2
         self.assertEqual(out, [])
 
 
+class TestReactionRecipe(unittest.TestCase):
+    """
+    Contains unit tests for the ReactionRecipe class.
+    """
+
+    def setUp(self):
+        """A function run before each unit test in this class."""
+        self.recipe = ReactionRecipe()
+        self.recipe.add_action(['BREAK_BOND', '*1', 1, '*2'])
+        self.recipe.add_action(['GAIN_RADICAL', '*1', '1'])
+        self.recipe.add_action(['GAIN_RADICAL', '*2', '1'])
+
+    def test_apply_forward_and_reverse(self):
+        """
+        Test that applying a recipe and then its reverse recovers the original structure.
+        """
+        mol = Molecule().from_smiles('CC')
+        carbons = [atom for atom in mol.atoms if atom.is_carbon()]
+        carbons[0].label = '*1'
+        carbons[1].label = '*2'
+        original = mol.copy(deep=True)
+
+        self.recipe.apply_forward(mol)
+        self.assertFalse(mol.has_bond(carbons[0], carbons[1]))
+        self.assertEqual([atom.radical_electrons for atom in carbons], [1, 1])
+
+        self.recipe.apply_reverse(mol)
+        self.assertTrue(mol.is_isomorphic(original))
+
+    def test_get_reverse(self):
+        """
+        Test that the reverse recipe swaps each action for its opposite.
+        """
+        recipe = ReactionRecipe()
+        recipe.add_action(['CHANGE_BOND', '*1', '1', '*2'])
+        recipe.add_action(['LOSE_PAIR', '*2', '1'])
+        reverse = recipe.get_reverse()
+        self.assertEqual(reverse.actions, [['GAIN_PAIR', '*2', '1'], ['CHANGE_BOND', '*1', '-1', '*2']])
+
+
 class TestTreeGeneration(unittest.TestCase):
 
     @classmethod
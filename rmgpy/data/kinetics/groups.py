@@ -117,16 +117,13 @@ class KineticsGroups(Database):
         forward_template = self.top[:]
 
         temporary = []
-        symmetric_tree = False
         for entry in forward_template:
             if entry not in temporary:
                 temporary.append(entry)
-            else:
+            elif len(forward_template) != 2:
                 # duplicate node found at top of tree
                 # eg. R_recombination: ['Y_rad', 'Y_rad']
-                if len(forward_template) != 2:
-                    raise DatabaseError('Can currently only do symmetric trees with nothing else in them')
-                symmetric_tree = True
+                raise DatabaseError('Can currently only do symmetric trees with nothing else in them')
         forward_template = temporary
 
         # Descend reactant trees as far as possible
@@ -154,6 +151,13 @@ class KineticsGroups(Database):
                 template.append(matched_node)
 
         else:
+            # The labeled atoms of each reactant are the same for every top-level node, so find them once
+            reactants = []
+            for reactant in reaction.reactants:
+                if isinstance(reactant, Species):
+                    reactant = reactant.molecule[0]
+                reactants.append((reactant, reactant.get_all_labeled_atoms()))
+
             for entry in forward_template:
                 # entry is a top-level node that should be matched
                 group = entry.item
@@ -163,17 +167,14 @@ class KineticsGroups(Database):
                 if not isinstance(entry.item, LogicNode):
                     atom_list = group.get_all_labeled_atoms()
 
-                for reactant in reaction.reactants:
-                    if isinstance(reactant, Species):
-                        reactant = reactant.molecule[0]
+                for reactant, atoms in reactants:
                     # Match labeled atoms
                     # Check that this reactant has each of the atom labels in this group.
                     # If it is a LogicNode, the atom_list is empty and
                     # it will proceed directly to the descend_tree step.
-                    if not all([reactant.contains_labeled_atom(label) for label in atom_list]):
+                    if not all(label in atoms for label in atom_list):
                         continue  # don't try to match this structure - the atoms aren't there!
                     # Match structures
-                    atoms = reactant.get_all_labeled_atoms()
                     # Descend the tree, making sure to match atomlabels exactly using strict = True
                     matched_node = self.descend_tree(reactant, atoms, root=entry, strict=True)
                     if matched_node is not None:
@@ -351,15 +352,23 @@ class KineticsGroups(Database):
         for entry in self.top:
             group_entries.extend(self.descendants(entry))
 
+        # Find each template group followed by its ancestors once, since these are needed several times below
+        lineages = {}
+        for template, kinetics in training_set:
+            for group in template:
+                if group not in lineages:
+                    lineages[group] = [group] + self.ancestors(group)
+
         # Determine a unique list of the groups we will be able to fit parameters for
         group_list = []
         for template, kinetics in training_set:
             for group in template:
                 if group not in self.top:
-                    group_list.append(group)
-                    group_list.extend(self.ancestors(group)[:-1])
+                    group_list.extend(lineages[group][:-1])
         group_list = list(set(group_list))
         group_list.sort(key=lambda x: x.index)
+        # Map each group to its position in group_list, for constant-time lookups
+        group_index = {group: i for i, group in enumerate(group_list)}
 
         if method == 'KineticsData':
             # Fit a discrete set of k(T) data points by training against k(T) data
@@ -378,7 +387,9 @@ class KineticsGroups(Database):
                 group_comments[entry] = set()
 
             # Generate least-squares matrix and vector
-            A = []
+            # Each row of the matrix is stored as the indices of the groups with nonzero coefficients, and the matrix
+            # is filled in at once after all rows are known
+            A_rows = []
             b = []
 
             kdata = []
@@ -396,54 +407,52 @@ class KineticsGroups(Database):
                 # Create every combination of each group and its ancestors with each other
                 combinations = []
                 for group in template:
-                    groups = [group]
-                    groups.extend(self.ancestors(group))
-                    combinations.append(groups)
+                    combinations.append(lineages[group])
                 combinations = get_all_combinations(combinations)
                 # Add a row to the matrix for each combination
+                brow = [math.log10(k) for k in kd]
                 for groups in combinations:
-                    Arow = [1 if group in groups else 0 for group in group_list]
-                    Arow.append(1)
-                    brow = [math.log10(k) for k in kd]
-                    A.append(Arow)
+                    A_rows.append(list({group_index[group] for group in groups if group in group_index}))
                     b.append(brow)
 
                     for group in groups:
                         group_comments[group].add("{0!s}".format(template))
 
-            if len(A) == 0:
+            if len(A_rows) == 0:
                 logging.warning('Unable to fit kinetics groups for family "{0}"; '
                                 'no valid data found.'.format(self.label))
                 return
-            A = np.array(A)
+            A = np.zeros((len(A_rows), len(group_list) + 1))
+            for row, columns in enumerate(A_rows):
+                A[row, columns] = 1
+            A[:, -1] = 1
             b = np.array(b)
             kdata = np.array(kdata)
 
             x, residues, rank, s = np.linalg.lstsq(A, b, rcond=RCOND)
 
+            # For each template, mark the fitted groups in the template (which contribute to the modeled rate) and
+            # the template groups and their ancestors (which share its error); the last column is the top node
+            model = np.zeros((len(training_set), len(group_list) + 1))
+            shared = np.zeros((len(training_set), len(group_list) + 1))
+            for index, (template, kinetics) in enumerate(training_set):
+                np.add.at(model[index], [group_index[group] for group in template if group in group_index], 1)
+                indices = []
+                for group in template:
+                    indices.extend(group_index[g] for g in lineages[group] if g not in self.top)
+                np.add.at(shared[index], indices, 1)
+            model[:, -1] = 1
+            shared[:, -1] = 1
+
+            # Determine error in each group (on log scale) at all temperatures at once
+            variance = (model.dot(x) - np.log10(kdata)) ** 2
+            variances = shared.T.dot(variance)
+            count = shared.sum(axis=0).astype(int)
+
+            import scipy.stats
             for t, T in enumerate(Tdata):
 
-                # Determine error in each group (on log scale)
-                stdev = np.zeros(len(group_list) + 1, np.float64)
-                count = np.zeros(len(group_list) + 1, np.int)
-
-                for index in range(len(training_set)):
-                    template, kinetics = training_set[index]
-                    kd = math.log10(kdata[index, t])
-                    km = x[-1, t] + sum([x[group_list.index(group), t] for group in template if group in group_list])
-                    variance = (km - kd) ** 2
-                    for group in template:
-                        groups = [group]
-                        groups.extend(self.ancestors(group))
-                        for g in groups:
-                            if g not in self.top:
-                                ind = group_list.index(g)
-                                stdev[ind] += variance
-                                count[ind] += 1
-                    stdev[-1] += variance
-                    count[-1] += 1
-                stdev = np.sqrt(stdev / (count - 1))
-                import scipy.stats
+                stdev = np.sqrt(variances[:, t] / (count - 1))
                 ci = scipy.stats.t.ppf(0.975, count - 1) * stdev
 
                 # Update dictionaries of fitted group values and uncertainties
@@ -452,8 +461,8 @@ class KineticsGroups(Database):
                         group_values[entry].append(10 ** x[-1, t])
                         group_uncertainties[entry].append(10 ** ci[-1])
                         group_counts[entry].append(count[-1])
-                    elif entry in group_list:
-                        index = group_list.index(entry)
+                    elif entry in group_index:
+                        index = group_index[entry]
                         group_values[entry].append(10 ** x[index, t])
                         group_uncertainties[entry].append(10 ** ci[index])
                         group_counts[entry].append(count[index])
@@ -482,7 +491,9 @@ class KineticsGroups(Database):
             logTdata = np.log(Tdata)
             Tinvdata = 1000. / (constants.R * Tdata)
 
-            A = []
+            # Each row of the matrix is stored as the indices of the groups with nonzero coefficients and the
+            # temperature index, and the matrix is filled in at once after all rows are known
+            A_rows = []
             b = []
 
             kdata = []
@@ -500,32 +511,29 @@ class KineticsGroups(Database):
                 # Create every combination of each group and its ancestors with each other
                 combinations = []
                 for group in template:
-                    groups = [group]
-                    groups.extend(self.ancestors(group))
-                    combinations.append(groups)
+                    combinations.append(lineages[group])
                 combinations = get_all_combinations(combinations)
 
                 # Add a row to the matrix for each combination at each temperature
+                columns = [list({group_index[group] for group in groups if group in group_index})
+                           for groups in combinations]
                 for t, T in enumerate(Tdata):
-                    logT = logTdata[t]
-                    Tinv = Tinvdata[t]
-                    for groups in combinations:
-                        Arow = []
-                        for group in group_list:
-                            if group in groups:
-                                Arow.extend([1, logT, -Tinv])
-                            else:
-                                Arow.extend([0, 0, 0])
-                        Arow.extend([1, logT, -Tinv])
-                        brow = math.log(kd[t])
-                        A.append(Arow)
+                    brow = math.log(kd[t])
+                    for group_columns in columns:
+                        A_rows.append((t, group_columns))
                         b.append(brow)
 
-            if len(A) == 0:
+            if len(A_rows) == 0:
                 logging.warning('Unable to fit kinetics groups for family "{0}"; '
                                 'no valid data found.'.format(self.label))
                 return
-            A = np.array(A)
+            # Each group (and the top node in the last three columns) contributes 1, ln(T), and -1000/(RT)
+            A = np.zeros((len(A_rows), 3 * (len(group_list) + 1)))
+            for row, (t, group_columns) in enumerate(A_rows):
+                group_columns = 3 * np.array(group_columns + [len(group_list)], np.int64)
+                A[row, group_columns] = 1
+                A[row, group_columns + 1] = logTdata[t]
+                A[row, group_columns + 2] = -Tinvdata[t]
             b = np.array(b)
             kdata = np.array(kdata)
 
@@ -549,7 +557,9 @@ class KineticsGroups(Database):
         elif method == 'Arrhenius2':
             # Fit Arrhenius parameters (A, n, Ea) by training against (A, n, Ea) values
 
-            A = []
+            # Each row of the matrix is stored as the indices of the groups with nonzero coefficients, and the matrix
+            # is filled in at once after all rows are known
+            A_rows = []
             b = []
 
             for template, kinetics in training_set:
@@ -557,32 +567,26 @@ class KineticsGroups(Database):
                 # Create every combination of each group and its ancestors with each other
                 combinations = []
                 for group in template:
-                    groups = [group]
-                    groups.extend(self.ancestors(group))
-                    combinations.append(groups)
+                    combinations.append(lineages[group])
                 combinations = get_all_combinations(combinations)
 
                 # Add a row to the matrix for each parameter
                 if (isinstance(kinetics, Arrhenius) or
                         (isinstance(kinetics, ArrheniusEP) and kinetics.alpha.value_si == 0)):
+                    Ea = kinetics.E0.value_si if isinstance(kinetics, ArrheniusEP) else kinetics.Ea.value_si
+                    brow = [math.log(kinetics.A.value_si), kinetics.n.value_si, Ea / 1000.]
                     for groups in combinations:
-                        Arow = []
-                        for group in group_list:
-                            if group in groups:
-                                Arow.append(1)
-                            else:
-                                Arow.append(0)
-                        Arow.append(1)
-                        Ea = kinetics.E0.value_si if isinstance(kinetics, ArrheniusEP) else kinetics.Ea.value_si
-                        brow = [math.log(kinetics.A.value_si), kinetics.n.value_si, Ea / 1000.]
-                        A.append(Arow)
+                        A_rows.append(list({group_index[group] for group in groups if group in group_index}))
                         b.append(brow)
 
-            if len(A) == 0:
+            if len(A_rows) == 0:
                 logging.warning('Unable to fit kinetics groups for family "{0}"; '
                                 'no valid data found.'.format(self.label))
                 return
-            A = np.array(A)
+            A = np.zeros((len(A_rows), len(group_list) + 1))
+            for row, columns in enumerate(A_rows):
+                A[row, columns] = 1
+            A[:, -1] = 1
             b = np.array(b)
 
             x, residues, rank, s = np.linalg.lstsq(A, b, rcond=RCOND)
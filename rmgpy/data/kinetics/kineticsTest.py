@@ -36,11 +36,13 @@ from external.wip import work_in_progress
 from rmgpy import settings
 from rmgpy.chemkin import load_chemkin_file
 from rmgpy.data.base import Entry, DatabaseError, ForbiddenStructures
-from rmgpy.data.kinetics.common import save_entry, find_degenerate_reactions, ensure_independent_atom_ids
+from rmgpy.data.kinetics.common import save_entry, find_degenerate_reactions, ensure_independent_atom_ids, \
+                                       get_fingerprint_key, fingerprints_could_match
 from rmgpy.data.kinetics.database import KineticsDatabase
 from rmgpy.data.kinetics.family import TemplateReaction
 from rmgpy.data.rmg import RMGDatabase
 from rmgpy.molecule.molecule import Molecule
+from rmgpy.reaction import Reaction
 from rmgpy.species import Species
 
 
@@ -148,6 +150,26 @@ class TestKineticsDatabase(unittest.TestCase):
         except DatabaseError:
             self.fail("Unable to load families using list ['H_Abstraction', 'pah']")
 
+    def test_load_libraries_in_parallel(self):
+        """Test that loading kinetics libraries in parallel gives the same result as loading them serially."""
+        path = os.path.join(settings['test_data.directory'], 'testing_database', 'kinetics', 'libraries')
+        libraries = ['GRI-Mech3.0', 'ethane-oxidation']
+        serial_database = KineticsDatabase()
+        serial_database.load_libraries(path, libraries=libraries)
+        parallel_database = KineticsDatabase()
+        parallel_database.load_libraries(path, libraries=libraries, procnum=2)
+
+        self.assertEqual(list(parallel_database.libraries.keys()), libraries)
+        for label in libraries:
+            serial_library = serial_database.libraries[label]
+            parallel_library = parallel_database.libraries[label]
+            self.assertEqual(list(parallel_library.entries.keys()), list(serial_library.entries.keys()))
+            for index, serial_entry in serial_library.entries.items():
+                parallel_entry = parallel_library.entries[index]
+                self.assertEqual(parallel_entry.label, serial_entry.label)
+                self.assertTrue(parallel_entry.item.is_isomorphic(serial_entry.item, either_direction=False))
+                self.assertEqual(repr(parallel_entry.data), repr(serial_entry.data))
+
 
 class TestReactionDegeneracy(unittest.TestCase):
 
@@ -771,6 +793,25 @@ class TestKinetics(unittest.TestCase):
         for atom in s2.molecule[0].atoms:
             self.assertNotEqual(atom.id, -1)
 
+    def test_fingerprints_could_match(self):
+        """
+        Test that fingerprints_could_match only rejects reactions with different formulas
+        """
+        ch4 = Species().from_smiles('C')
+        oh = Species().from_smiles('[OH]')
+        ch3 = Species().from_smiles('[CH3]')
+        h2o = Species().from_smiles('O')
+        reaction = Reaction(reactants=[ch4, oh], products=[ch3, h2o])
+        reactants_key = get_fingerprint_key([oh, ch4])
+        products_key = get_fingerprint_key([h2o, ch3])
+
+        self.assertTrue(fingerprints_could_match(reaction, reactants_key, products_key))
+        self.assertTrue(fingerprints_could_match(reaction, products_key, reactants_key))
+        self.assertTrue(fingerprints_could_match(reaction, products_key))
+        self.assertTrue(fingerprints_could_match(reaction, None))
+        self.assertFalse(fingerprints_could_match(reaction, reactants_key, reactants_key))
+        self.assertFalse(fingerprints_could_match(reaction, get_fingerprint_key([ch4, ch4])))
+
     def test_save_entry(self):
         """
         tests that save entry can run
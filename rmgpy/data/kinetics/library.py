@@ -32,6 +32,7 @@ This module contains functionality for working with kinetics libraries.
 """
 
 import codecs
+import io
 import logging
 import os.path
 import re
@@ -40,7 +41,7 @@ from collections import OrderedDict
 import numpy as np
 
 from rmgpy.data.base import DatabaseError, Database, Entry
-from rmgpy.data.kinetics.common import save_entry
+from rmgpy.data.kinetics.common import save_entry, save_entries
 from rmgpy.data.kinetics.family import TemplateReaction
 from rmgpy.kinetics import Arrhenius, ThirdBody, Lindemann, Troe, \
                            PDepArrhenius, MultiArrhenius, MultiPDepArrhenius, Chebyshev
@@ -581,8 +582,7 @@ class KineticsLibrary(Database):
             f.write('site = "{0}"\n'.format(self.site))
         f.write('autoGenerated={0}\n'.format(self.auto_generated))
 
-        for entry in entries:
-            self.save_entry(f, entry)
+        save_entries(f, entries)
 
         f.close()
 
@@ -619,17 +619,18 @@ class KineticsLibrary(Database):
             reactions.extend(pdep_reactions)
 
         self.entries = {}
-        for index, reaction in enumerate(reactions):
-            entry = Entry(
-                index=index + 1,
+        for index, reaction in enumerate(reactions, 1):
+            # Move the kinetics from the reaction onto the entry, as for
+            # entries loaded from new-style libraries
+            kinetics, reaction.kinetics = reaction.kinetics, None
+            self.entries[index] = Entry(
+                index=index,
                 item=reaction,
-                data=reaction.kinetics,
-                label=str(reaction)
+                data=kinetics,
+                label=str(reaction),
+                long_desc=kinetics.comment,
             )
-            entry.long_desc = reaction.kinetics.comment
-            reaction.kinetics.comment = ''
-            self.entries[index + 1] = entry
-            reaction.kinetics = None
+            kinetics.comment = ''
 
         self.check_for_duplicates()
         self.convert_duplicates_to_multi()
@@ -643,10 +644,10 @@ class KineticsLibrary(Database):
         is a seed mechanism.
         """
         from rmgpy.chemkin import read_reactions_block
-        f = open(path, 'r')
-        reaction_list = read_reactions_block(f, species_dict=species)
-        f.close()
-        return reaction_list
+        # Read the whole file at once and parse it from memory
+        with open(path, 'r') as f:
+            data = io.StringIO(f.read())
+        return read_reactions_block(data, species_dict=species)
 
     def save_old(self, path):
         """
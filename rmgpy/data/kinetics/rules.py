@@ -41,7 +41,7 @@ from copy import deepcopy
 
 import numpy as np
 
-from rmgpy.data.base import Database, Entry, get_all_combinations
+from rmgpy.data.base import Database, Entry
 from rmgpy.data.kinetics.common import save_entry
 from rmgpy.exceptions import KineticsError, DatabaseError
 from rmgpy.kinetics import ArrheniusEP, Arrhenius, StickingCoefficientBEP, SurfaceArrheniusBEP
@@ -49,6 +49,56 @@ from rmgpy.quantity import Quantity, ScalarQuantity
 from rmgpy.reaction import Reaction
 
 
+# The names of all of the RMG reaction families that are bimolecular
+_BIMOLECULAR_KINETICS_FAMILIES = frozenset([
+    'H_Abstraction',
+    'R_Addition_MultipleBond',
+    'R_Recombination',
+    'Disproportionation',
+    '1+2_Cycloaddition',
+    '2+2_cycloaddition_Cd',
+    '2+2_cycloaddition_CO',
+    '2+2_cycloaddition_CCO',
+    'Diels_alder_addition',
+    '1,2_Insertion',
+    '1,3_Insertion_CO2',
+    '1,3_Insertion_ROR',
+    'R_Addition_COm',
+    'Oa_R_Recombination',
+    'Substitution_O',
+    'SubstitutionS',
+    'R_Addition_CSm',
+    '1,3_Insertion_RSR',
+    'lone_electron_pair_bond',
+])
+
+# The names of all of the RMG reaction families that are unimolecular
+_UNIMOLECULAR_KINETICS_FAMILIES = frozenset([
+    'intra_H_migration',
+    'Birad_recombination',
+    'intra_OH_migration',
+    'HO2_Elimination_from_PeroxyRadical',
+    'H_shift_cyclopentadiene',
+    'Cyclic_Ether_Formation',
+    'Intra_R_Add_Exocyclic',
+    'Intra_R_Add_Endocyclic',
+    '1,2-Birad_to_alkene',
+    'Intra_Disproportionation',
+    'Korcek_step1',
+    'Korcek_step2',
+    '1,2_shiftS',
+    'intra_substitutionCS_cyclization',
+    'intra_substitutionCS_isomerization',
+    'intra_substitutionS_cyclization',
+    'intra_substitutionS_isomerization',
+    'intra_NO2_ONO_conversion',
+    '1,4_Cyclic_birad_scission',
+    '1,4_Linear_birad_scission',
+    'Intra_Diels_alder',
+    'ketoenol',
+    'Retroen',
+])
+
 ################################################################################
 
 class KineticsRules(Database):
@@ -115,60 +165,11 @@ class KineticsRules(Database):
         """
         warnings.warn("The old kinetics databases are no longer supported and may be"
                       " removed in version 2.3.", DeprecationWarning)
-        # The names of all of the RMG reaction families that are bimolecular
-        BIMOLECULAR_KINETICS_FAMILIES = [
-            'H_Abstraction',
-            'R_Addition_MultipleBond',
-            'R_Recombination',
-            'Disproportionation',
-            '1+2_Cycloaddition',
-            '2+2_cycloaddition_Cd',
-            '2+2_cycloaddition_CO',
-            '2+2_cycloaddition_CCO',
-            'Diels_alder_addition',
-            '1,2_Insertion',
-            '1,3_Insertion_CO2',
-            '1,3_Insertion_ROR',
-            'R_Addition_COm',
-            'Oa_R_Recombination',
-            'Substitution_O',
-            'SubstitutionS',
-            'R_Addition_CSm',
-            '1,3_Insertion_RSR',
-            'lone_electron_pair_bond',
-        ]
-
-        # The names of all of the RMG reaction families that are unimolecular
-        UNIMOLECULAR_KINETICS_FAMILIES = [
-            'intra_H_migration',
-            'Birad_recombination',
-            'intra_OH_migration',
-            'HO2_Elimination_from_PeroxyRadical',
-            'H_shift_cyclopentadiene',
-            'Cyclic_Ether_Formation',
-            'Intra_R_Add_Exocyclic',
-            'Intra_R_Add_Endocyclic',
-            '1,2-Birad_to_alkene',
-            'Intra_Disproportionation',
-            'Korcek_step1',
-            'Korcek_step2',
-            '1,2_shiftS',
-            'intra_substitutionCS_cyclization',
-            'intra_substitutionCS_isomerization',
-            'intra_substitutionS_cyclization',
-            'intra_substitutionS_isomerization',
-            'intra_NO2_ONO_conversion',
-            '1,4_Cyclic_birad_scission',
-            '1,4_Linear_birad_scission',
-            'Intra_Diels_alder',
-            'ketoenol',
-            'Retroen'
-        ]
         # This is hardcoding of reaction families!
         label = os.path.split(self.label)[-2]
-        if label in BIMOLECULAR_KINETICS_FAMILIES:
+        if label in _BIMOLECULAR_KINETICS_FAMILIES:
             Aunits = 'cm^3/(mol*s)'
-        elif label in UNIMOLECULAR_KINETICS_FAMILIES:
+        elif label in _UNIMOLECULAR_KINETICS_FAMILIES:
             Aunits = 's^-1'
         else:
             raise Exception('Unable to determine preexponential units for old reaction family '
@@ -472,21 +473,18 @@ class KineticsRules(Database):
         children_list = []
         distance_list = []
         for i, parent in enumerate(root_template):
-            # Start with the root template, and replace the ith member with its children
-            if parent.children:
-                children_set = [[group] for group in root_template]
-                children_set[i] = parent.children
-                children_list.extend(get_all_combinations(children_set))
-                distance_list.extend([k.nodal_distance for k in parent.children])
-
-        if distance_list != []:  # average the minimum distance neighbors
-            min_dist = min(distance_list)
-            close_children_list = [children_list[i] for i in range(len(children_list)) if distance_list[i] == min_dist]
-        else:
-            close_children_list = []
+            # Start with the root template, and replace the ith member with each of its children
+            for child in parent.children:
+                template = list(root_template)
+                template[i] = child
+                children_list.append(template)
+                distance_list.append(child.nodal_distance)
+
+        # average the minimum distance neighbors
+        min_dist = min(distance_list) if distance_list else None
 
         kinetics_list = []
-        for template in children_list:
+        for template, distance in zip(children_list, distance_list):
             label = ';'.join([g.label for g in template])
 
             if label in already_done:
@@ -494,7 +492,7 @@ class KineticsRules(Database):
             else:
                 kinetics = self.fill_rules_by_averaging_up(template, already_done, verbose)
 
-            if template in close_children_list and kinetics is not None:
+            if distance == min_dist and kinetics is not None:
                 kinetics_list.append([kinetics, template])
 
         # See if we already have a rate rule for this exact template instead
@@ -644,11 +642,13 @@ class KineticsRules(Database):
                 # from the specified template
                 norms = [np.linalg.norm(d) for d in distances]
                 new_min_norm = min(norms)
-                if new_min_norm == min_norm:
-                    saved_kinetics.extend([pair for pair, norm in zip(kinetics_list, norms) if norm == min(norms)])
-                elif new_min_norm < min_norm:
-                    min_norm = new_min_norm
-                    saved_kinetics = [pair for pair, norm in zip(kinetics_list, norms) if norm == min(norms)]
+                if new_min_norm <= min_norm:
+                    closest_kinetics = [pair for pair, norm in zip(kinetics_list, norms) if norm == new_min_norm]
+                    if new_min_norm == min_norm:
+                        saved_kinetics.extend(closest_kinetics)
+                    else:
+                        min_norm = new_min_norm
+                        saved_kinetics = closest_kinetics
 
             template_list0 = template_list  # keep the old template list
             distance_list0 = distance_list  # keep thge old distance list
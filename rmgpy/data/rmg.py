@@ -83,7 +83,8 @@ class RMGDatabase(object):
              depository=True,
              solvation=True,
              surface=True,  # on by default, because solvation is also on by default
-             testing=False):
+             testing=False,
+             procnum=1):
         """
         Load the RMG database from the given `path` on disk, where `path`
         points to the top-level folder of the RMG database. If none of the
@@ -92,6 +93,7 @@ class RMGDatabase(object):
         components of the database be loaded.
 
         Argument testing will load a lighter version of the database used for unit-tests
+        Argument procnum sets the number of processes used to parse the kinetics libraries
         """
         if not testing:
             self.load_transport(os.path.join(path, 'transport'), transport_libraries)
@@ -100,7 +102,8 @@ class RMGDatabase(object):
                            reaction_libraries,
                            seed_mechanisms,
                            kinetics_families,
-                           kinetics_depositories
+                           kinetics_depositories,
+                           procnum=procnum
                            )
         if not testing:
             self.load_statmech(os.path.join(path, 'statmech'), statmech_libraries, depository)
@@ -145,11 +148,13 @@ class RMGDatabase(object):
                       reaction_libraries=None,
                       seed_mechanisms=None,
                       kinetics_families=None,
-                      kinetics_depositories=None
+                      kinetics_depositories=None,
+                      procnum=1
                       ):
         """
         Load the RMG kinetics database from the given `path` on disk, where
         `path` points to the top-level folder of the RMG kinetics database.
+        The kinetics libraries are parsed by `procnum` processes.
         """
         kinetics_libraries = []
         library_order = []
@@ -169,7 +174,8 @@ class RMGDatabase(object):
         self.kinetics.load(path,
                            families=kinetics_families,
                            libraries=kinetics_libraries,
-                           depositories=kinetics_depositories
+                           depositories=kinetics_depositories,
+                           procnum=procnum
                            )
 
     def load_solvation(self, path):
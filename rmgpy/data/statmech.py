@@ -685,7 +685,7 @@ class StatmechDatabase(object):
         """
         items = []
         for name, depository in self.depository.items():
-            for label, entry in depository.entries.items():
+            for entry in depository.entries.values():
                 if molecule.is_isomorphic(entry.item):
                     items.append((entry.data, self.depository[name], entry))
         return items
@@ -696,7 +696,7 @@ class StatmechDatabase(object):
         by searching the entries in the specified :class:`StatmechLibrary` object
         `library`. Returns ``None`` if no data was found.
         """
-        for label, entry in library.entries.items():
+        for entry in library.entries.values():
             if molecule.is_isomorphic(entry.item):
                 return entry.data, library, entry
         return None
@@ -57,6 +57,73 @@ _multiplicity_labels = {1: 'S', 2: 'D', 3: 'T', 4: 'Q', 5: 'V'}
 
 ################################################################################
 
+def _save_thermo_data(f, thermo):
+    """
+    Write the given :class:`ThermoData` object `thermo` of a thermo database entry to the file object `f`.
+    """
+    f.write('    thermo = ThermoData(\n')
+    f.write('        Tdata = {0!r},\n'.format(thermo.Tdata))
+    f.write('        Cpdata = {0!r},\n'.format(thermo.Cpdata))
+    f.write('        H298 = {0!r},\n'.format(thermo.H298))
+    f.write('        S298 = {0!r},\n'.format(thermo.S298))
+    if thermo.Tmin is not None:
+        f.write('        Tmin = {0!r},\n'.format(thermo.Tmin))
+    if thermo.Tmax is not None:
+        f.write('        Tmax = {0!r},\n'.format(thermo.Tmax))
+    f.write('    ),\n')
+
+
+def _save_wilhoit(f, thermo):
+    """
+    Write the given :class:`Wilhoit` object `thermo` of a thermo database entry to the file object `f`.
+    """
+    f.write('    thermo = Wilhoit(\n')
+    f.write('        cp0 = {0!r},\n'.format(thermo.cp0))
+    f.write('        cpInf = {0!r},\n'.format(thermo.cpInf))
+    f.write('        a0 = {0:g},\n'.format(thermo.a0))
+    f.write('        a1 = {0:g},\n'.format(thermo.a1))
+    f.write('        a2 = {0:g},\n'.format(thermo.a2))
+    f.write('        a3 = {0:g},\n'.format(thermo.a3))
+    f.write('        B = {0!r},\n'.format(thermo.B))
+    f.write('        H0 = {0!r},\n'.format(thermo.H0))
+    f.write('        S0 = {0!r},\n'.format(thermo.S0))
+    if thermo.Tmin is not None:
+        f.write('        Tmin = {0!r},\n'.format(thermo.Tmin))
+    if thermo.Tmax is not None:
+        f.write('        Tmax = {0!r},\n'.format(thermo.Tmax))
+    f.write('    ),\n')
+
+
+def _save_nasa(f, thermo):
+    """
+    Write the given :class:`NASA` object `thermo` of a thermo database entry to the file object `f`.
+    """
+    f.write('    thermo = NASA(\n')
+    f.write('        polynomials = [\n')
+    for poly in thermo.polynomials:
+        f.write('            {0!r},\n'.format(poly))
+    f.write('        ],\n')
+    if thermo.Tmin is not None:
+        f.write('        Tmin = {0!r},\n'.format(thermo.Tmin))
+    if thermo.Tmax is not None:
+        f.write('        Tmax = {0!r},\n'.format(thermo.Tmax))
+    if thermo.E0 is not None:
+        f.write('        E0 = {0!r},\n'.format(thermo.E0))
+    if thermo.Cp0 is not None:
+        f.write('        Cp0 = {0!r},\n'.format(thermo.Cp0))
+    if thermo.CpInf is not None:
+        f.write('        CpInf = {0!r},\n'.format(thermo.CpInf))
+    f.write('    ),\n')
+
+
+# Writers for the thermo models that save_entry spells out field by field, keyed by type
+_thermo_writers = {
+    ThermoData: _save_thermo_data,
+    Wilhoit: _save_wilhoit,
+    NASA: _save_nasa,
+}
+
+
 def save_entry(f, entry):
     """
     Write a Pythonic string representation of the given `entry` in the thermo
@@ -80,50 +147,15 @@ def save_entry(f, entry):
     else:
         f.write('    group = "{0}",\n'.format(entry.item))
 
-    if isinstance(entry.data, ThermoData):
-        f.write('    thermo = ThermoData(\n')
-        f.write('        Tdata = {0!r},\n'.format(entry.data.Tdata))
-        f.write('        Cpdata = {0!r},\n'.format(entry.data.Cpdata))
-        f.write('        H298 = {0!r},\n'.format(entry.data.H298))
-        f.write('        S298 = {0!r},\n'.format(entry.data.S298))
-        if entry.data.Tmin is not None:
-            f.write('        Tmin = {0!r},\n'.format(entry.data.Tmin))
-        if entry.data.Tmax is not None:
-            f.write('        Tmax = {0!r},\n'.format(entry.data.Tmax))
-        f.write('    ),\n')
-    elif isinstance(entry.data, Wilhoit):
-        f.write('    thermo = Wilhoit(\n')
-        f.write('        cp0 = {0!r},\n'.format(entry.data.cp0))
-        f.write('        cpInf = {0!r},\n'.format(entry.data.cpInf))
-        f.write('        a0 = {0:g},\n'.format(entry.data.a0))
-        f.write('        a1 = {0:g},\n'.format(entry.data.a1))
-        f.write('        a2 = {0:g},\n'.format(entry.data.a2))
-        f.write('        a3 = {0:g},\n'.format(entry.data.a3))
-        f.write('        B = {0!r},\n'.format(entry.data.B))
-        f.write('        H0 = {0!r},\n'.format(entry.data.H0))
-        f.write('        S0 = {0!r},\n'.format(entry.data.S0))
-        if entry.data.Tmin is not None:
-            f.write('        Tmin = {0!r},\n'.format(entry.data.Tmin))
-        if entry.data.Tmax is not None:
-            f.write('        Tmax = {0!r},\n'.format(entry.data.Tmax))
-        f.write('    ),\n')
-    elif isinstance(entry.data, NASA):
-        f.write('    thermo = NASA(\n')
-        f.write('        polynomials = [\n')
-        for poly in entry.data.polynomials:
-            f.write('            {0!r},\n'.format(poly))
-        f.write('        ],\n')
-        if entry.data.Tmin is not None:
-            f.write('        Tmin = {0!r},\n'.format(entry.data.Tmin))
-        if entry.data.Tmax is not None:
-            f.write('        Tmax = {0!r},\n'.format(entry.data.Tmax))
-        if entry.data.E0 is not None:
-            f.write('        E0 = {0!r},\n'.format(entry.data.E0))
-        if entry.data.Cp0 is not None:
-            f.write('        Cp0 = {0!r},\n'.format(entry.data.Cp0))
-        if entry.data.CpInf is not None:
-            f.write('        CpInf = {0!r},\n'.format(entry.data.CpInf))
-        f.write('    ),\n')
+    writer = _thermo_writers.get(type(entry.data))
+    if writer is None:
+        # Fall back to isinstance checks for subclasses of the known thermo models
+        for thermo_class, thermo_writer in _thermo_writers.items():
+            if isinstance(entry.data, thermo_class):
+                writer = thermo_writer
+                break
+    if writer is not None:
+        writer(f, entry.data)
     else:
         f.write('    thermo = {0!r},\n'.format(entry.data))
 
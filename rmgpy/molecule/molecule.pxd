@@ -78,15 +78,15 @@ cdef class Atom(Vertex):
     
     cpdef bint is_surface_site(self)
     
-    cpdef increment_radical(self)
+    cpdef increment_radical(self, short radical=?)
 
-    cpdef decrement_radical(self)
+    cpdef decrement_radical(self, short radical=?)
     
     cpdef set_lone_pairs(self, int lone_pairs)
     
-    cpdef increment_lone_pairs(self)
+    cpdef increment_lone_pairs(self, short pairs=?)
     
-    cpdef decrement_lone_pairs(self)
+    cpdef decrement_lone_pairs(self, short pairs=?)
     
     cpdef update_charge(self)
 
@@ -38,6 +38,7 @@ describe the corresponding atom or bond.
 import itertools
 import logging
 import os
+import sys
 from collections import OrderedDict, defaultdict
 from copy import deepcopy
 from urllib.parse import quote
@@ -411,25 +412,25 @@ class Atom(Vertex):
         """
         return self.element.number in [7, 8, 16]
 
-    def increment_radical(self):
+    def increment_radical(self, radical=1):
         """
         Update the atom pattern as a result of applying a GAIN_RADICAL action,
         where `radical` specifies the number of radical electrons to add.
         """
         # Set the new radical electron count
-        self.radical_electrons += 1
+        self.radical_electrons += radical
         if self.radical_electrons <= 0:
             raise gr.ActionError('Unable to update Atom due to GAIN_RADICAL action: '
                                  'Invalid radical electron set "{0}".'.format(self.radical_electrons))
 
-    def decrement_radical(self):
+    def decrement_radical(self, radical=1):
         """
         Update the atom pattern as a result of applying a LOSE_RADICAL action,
         where `radical` specifies the number of radical electrons to remove.
         """
         cython.declare(radical_electrons=cython.short)
         # Set the new radical electron count
-        radical_electrons = self.radical_electrons = self.radical_electrons - 1
+        radical_electrons = self.radical_electrons = self.radical_electrons - radical
         if radical_electrons < 0:
             raise gr.ActionError('Unable to update Atom due to LOSE_RADICAL action: '
                                  'Invalid radical electron set "{0}".'.format(self.radical_electrons))
@@ -445,23 +446,25 @@ class Atom(Vertex):
                                  'Invalid lone electron pairs set "{0}".'.format(self.set_lone_pairs))
         self.update_charge()
 
-    def increment_lone_pairs(self):
+    def increment_lone_pairs(self, pairs=1):
         """
-        Update the lone electron pairs pattern as a result of applying a GAIN_PAIR action.
+        Update the lone electron pairs pattern as a result of applying a GAIN_PAIR action,
+        where `pairs` specifies the number of lone electron pairs to add.
         """
         # Set the new lone electron pairs count
-        self.lone_pairs += 1
+        self.lone_pairs += pairs
         if self.lone_pairs <= 0:
             raise gr.ActionError('Unable to update Atom due to GAIN_PAIR action: '
                                  'Invalid lone electron pairs set "{0}".'.format(self.lone_pairs))
         self.update_charge()
 
-    def decrement_lone_pairs(self):
+    def decrement_lone_pairs(self, pairs=1):
         """
-        Update the lone electron pairs pattern as a result of applying a LOSE_PAIR action.
+        Update the lone electron pairs pattern as a result of applying a LOSE_PAIR action,
+        where `pairs` specifies the number of lone electron pairs to remove.
         """
         # Set the new lone electron pairs count
-        self.lone_pairs -= 1
+        self.lone_pairs -= pairs
         if self.lone_pairs < 0:
             raise gr.ActionError('Unable to update Atom due to LOSE_PAIR action: '
                                  'Invalid lone electron pairs set "{0}".'.format(self.lone_pairs))
@@ -494,13 +497,13 @@ class Atom(Vertex):
             # Nothing else to do here
             pass
         elif act == 'GAIN_RADICAL':
-            for i in range(action[2]): self.increment_radical()
+            if action[2] > 0: self.increment_radical(action[2])
         elif act == 'LOSE_RADICAL':
-            for i in range(abs(action[2])): self.decrement_radical()
-        elif action[0].upper() == 'GAIN_PAIR':
-            for i in range(action[2]): self.increment_lone_pairs()
-        elif action[0].upper() == 'LOSE_PAIR':
-            for i in range(abs(action[2])): self.decrement_lone_pairs()
+            if action[2] != 0: self.decrement_radical(abs(action[2]))
+        elif act == 'GAIN_PAIR':
+            if action[2] > 0: self.increment_lone_pairs(action[2])
+        elif act == 'LOSE_PAIR':
+            if action[2] != 0: self.decrement_lone_pairs(abs(action[2]))
         else:
             raise gr.ActionError('Unable to update Atom: Invalid action {0}".'.format(action))
 
@@ -996,7 +999,8 @@ class Molecule(Graph):
             element_dict = {'C': 0, 'H': 0, 'N': 0, 'O': 0, 'S': 0}
             all_elements = sorted(self.get_element_count().items(), key=lambda x: x[0])  # Sort alphabetically
             element_dict.update(all_elements)
-            self._fingerprint = ''.join([f'{symbol}{num:0>2}' for symbol, num in element_dict.items()])
+            # Intern the string, so that equal fingerprints are usually the same object and compare by identity
+            self._fingerprint = sys.intern(''.join([f'{symbol}{num:0>2}' for symbol, num in element_dict.items()]))
         return self._fingerprint
 
     @fingerprint.setter
@@ -1535,6 +1539,10 @@ class Molecule(Graph):
                 'Got a {0} object for parameter "other", when a Group object is required.'.format(other.__class__))
         group = other
 
+        # Every atom in the group must map onto a distinct atom
+        if len(self.vertices) < len(group.vertices):
+            return False
+
         # Check multiplicity
         if group.multiplicity:
             if self.multiplicity not in group.multiplicity: return False
@@ -1544,12 +1552,13 @@ class Molecule(Graph):
             return False
 
         # Compare element counts
-        element_count = self.get_element_count()
-        for element, count in group.elementCount.items():
-            if element not in element_count:
-                return False
-            elif element_count[element] < count:
-                return False
+        if group.elementCount:
+            element_count = self.get_element_count()
+            for element, count in group.elementCount.items():
+                if element not in element_count:
+                    return False
+                elif element_count[element] < count:
+                    return False
 
         if generate_initial_map:
             keys = []
@@ -1606,6 +1615,10 @@ class Molecule(Graph):
                 'Got a {0} object for parameter "other", when a Group object is required.'.format(other.__class__))
         group = other
 
+        # Every atom in the group must map onto a distinct atom
+        if len(self.vertices) < len(group.vertices):
+            return []
+
         # Check multiplicity
         if group.multiplicity:
             if self.multiplicity not in group.multiplicity: return []
@@ -1615,12 +1628,13 @@ class Molecule(Graph):
             return []
 
         # Compare element counts
-        element_count = self.get_element_count()
-        for element, count in group.elementCount.items():
-            if element not in element_count:
-                return []
-            elif element_count[element] < count:
-                return []
+        if group.elementCount:
+            element_count = self.get_element_count()
+            for element, count in group.elementCount.items():
+                if element not in element_count:
+                    return []
+                elif element_count[element] < count:
+                    return []
 
         # Do the isomorphism comparison
         result = Graph.find_subgraph_isomorphisms(self, other, initial_map, save_order=save_order)
@@ -341,6 +341,29 @@ class TestAtom(unittest.TestCase):
             self.assertEqual(atom0.charge, atom.charge)
             self.assertEqual(atom0.label, atom.label)
 
+    def test_apply_action_radical_magnitude(self):
+        """
+        Test that Atom.apply_action() applies a multi-electron radical change in one call.
+        """
+        atom = Atom(element='C', radical_electrons=0, charge=0, label='*1', lone_pairs=0)
+        atom.apply_action(['GAIN_RADICAL', '*1', 2])
+        self.assertEqual(atom.radical_electrons, 2)
+        atom.apply_action(['LOSE_RADICAL', '*1', 2])
+        self.assertEqual(atom.radical_electrons, 0)
+        with self.assertRaises(ActionError):
+            atom.apply_action(['LOSE_RADICAL', '*1', 1])
+
+    def test_apply_action_zero_magnitude(self):
+        """
+        Test that Atom.apply_action() leaves the atom unchanged for a zero radical or lone pair change.
+        """
+        atom = Atom(element='C', radical_electrons=0, charge=1, label='*1', lone_pairs=0)
+        for action in ['GAIN_RADICAL', 'LOSE_RADICAL', 'GAIN_PAIR', 'LOSE_PAIR']:
+            atom.apply_action([action, '*1', 0])
+            self.assertEqual(atom.radical_electrons, 0)
+            self.assertEqual(atom.lone_pairs, 0)
+            self.assertEqual(atom.charge, 1)
+
     def test_equivalent(self):
         """
         Test the Atom.equivalent() method.
@@ -1223,6 +1246,20 @@ multiplicity 2
         mapping = molecule.find_subgraph_isomorphisms(group_ring)
         self.assertEqual(len(mapping), 5)
 
+    def test_subgraph_isomorphism_larger_group(self):
+        """
+        Check that a group with more atoms than the molecule does not match.
+        """
+        molecule = Molecule().from_smiles('[H][H]')
+        group = Group().from_adjacency_list("""
+1 *1 R u0 {2,S}
+2 *2 R u0 {1,S} {3,S}
+3 *3 R u0 {2,S}
+        """)
+
+        self.assertFalse(molecule.is_subgraph_isomorphic(group))
+        self.assertEqual(molecule.find_subgraph_isomorphisms(group), [])
+
     def test_lax_isomorphism(self):
         """Test that we can do isomorphism comparison with strict=False"""
         mol1 = Molecule().from_adjacency_list("""
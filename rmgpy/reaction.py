@@ -464,49 +464,41 @@ class Reaction:
                                       strict=strict,
                                       save_order=save_order)
 
-        # Compare reactants to reactants
-        forward_reactants_match = same_species_lists(self.reactants, other.reactants,
-                                                     check_identical=check_identical,
-                                                     only_check_label=check_only_label,
-                                                     generate_initial_map=generate_initial_map,
-                                                     strict=strict,
-                                                     save_order=save_order)
-
-        # Compare products to products
-        forward_products_match = same_species_lists(self.products, other.products,
-                                                    check_identical=check_identical,
-                                                    only_check_label=check_only_label,
-                                                    generate_initial_map=generate_initial_map,
-                                                    strict=strict,
-                                                    save_order=save_order)
-
-        # Compare specific_collider to specific_collider
+        # Compare specific_collider to specific_collider, which must match in either direction
         collider_match = (self.specific_collider == other.specific_collider)
+        if not collider_match:
+            return False
 
-        # Return now, if we can
-        if forward_reactants_match and forward_products_match and collider_match:
+        # Compare reactants to reactants, then products to products only if the reactants match
+        if (same_species_lists(self.reactants, other.reactants,
+                               check_identical=check_identical,
+                               only_check_label=check_only_label,
+                               generate_initial_map=generate_initial_map,
+                               strict=strict,
+                               save_order=save_order) and
+                same_species_lists(self.products, other.products,
+                                   check_identical=check_identical,
+                                   only_check_label=check_only_label,
+                                   generate_initial_map=generate_initial_map,
+                                   strict=strict,
+                                   save_order=save_order)):
             return True
         if not either_direction:
             return False
 
-        # Compare reactants to products
-        reverse_reactants_match = same_species_lists(self.reactants, other.products,
-                                                     check_identical=check_identical,
-                                                     only_check_label=check_only_label,
-                                                     generate_initial_map=generate_initial_map,
-                                                     strict=strict,
-                                                     save_order=save_order)
-
-        # Compare products to reactants
-        reverse_products_match = same_species_lists(self.products, other.reactants,
-                                                    check_identical=check_identical,
-                                                    only_check_label=check_only_label,
-                                                    generate_initial_map=generate_initial_map,
-                                                    strict=strict,
-                                                    save_order=save_order)
-
-        # should have already returned if it matches forwards, or we're not allowed to match backwards
-        return reverse_reactants_match and reverse_products_match and collider_match
+        # Compare reactants to products, then products to reactants only if the first comparison matches
+        return (same_species_lists(self.reactants, other.products,
+                                   check_identical=check_identical,
+                                   only_check_label=check_only_label,
+                                   generate_initial_map=generate_initial_map,
+                                   strict=strict,
+                                   save_order=save_order) and
+                same_species_lists(self.products, other.reactants,
+                                   check_identical=check_identical,
+                                   only_check_label=check_only_label,
+                                   generate_initial_map=generate_initial_map,
+                                   strict=strict,
+                                   save_order=save_order))
 
     def get_enthalpy_of_reaction(self, T):
         """
@@ -1414,7 +1406,10 @@ def same_species_lists(list1, list2, check_identical=False, only_check_label=Fal
 
     def same(object1, object2, _check_identical=check_identical, _only_check_label=only_check_label,
              _generate_initial_map=generate_initial_map, _strict=strict, save_order=save_order):
-        if _only_check_label:
+        if object1 is object2:
+            # The same object is trivially the same under every comparison below
+            return True
+        elif _only_check_label:
             return str(object1) == str(object2)
         elif _check_identical:
             return object1.is_identical(object2, strict=_strict)
@@ -1430,29 +1425,19 @@ def same_species_lists(list1, list2, check_identical=False, only_check_label=Fal
             return True
         elif same(list1[0], list2[1]) and same(list1[1], list2[0]):
             return True
-    elif len(list1) == len(list2) == 3:
-        if same(list1[0], list2[0]):
-            if same(list1[1], list2[1]):
-                if same(list1[2], list2[2]):
-                    return True
-            elif same(list1[1], list2[2]):
-                if same(list1[2], list2[1]):
-                    return True
-        elif same(list1[0], list2[1]):
-            if same(list1[1], list2[0]):
-                if same(list1[2], list2[2]):
-                    return True
-            elif same(list1[1], list2[2]):
-                if same(list1[2], list2[0]):
-                    return True
-        elif same(list1[0], list2[2]):
-            if same(list1[1], list2[0]):
-                if same(list1[2], list2[1]):
-                    return True
-            elif same(list1[1], list2[1]):
-                if same(list1[2], list2[0]):
-                    return True
-    elif len(list1) == len(list2):
+    elif len(list1) == len(list2) >= 3:
+        # Match each item of list1 to the first remaining equivalent item of list2,
+        # which for three items is the same search as trying each permutation in turn
+        remaining = list(list2)
+        for object1 in list1:
+            for index, object2 in enumerate(remaining):
+                if same(object1, object2):
+                    del remaining[index]
+                    break
+            else:
+                return False
+        return True
+    elif len(list1) == len(list2) == 0:
         raise NotImplementedError("Can't check isomorphism of lists with {0} species/molecules".format(len(list1)))
     # nothing found
     return False
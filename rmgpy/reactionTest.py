@@ -42,7 +42,7 @@ from rmgpy.kinetics import Arrhenius, ArrheniusEP, MultiArrhenius, PDepArrhenius
     ThirdBody, Troe, Lindemann, Chebyshev, SurfaceArrhenius, StickingCoefficient
 from rmgpy.molecule import Molecule
 from rmgpy.quantity import Quantity
-from rmgpy.reaction import Reaction
+from rmgpy.reaction import Reaction, same_species_lists
 from rmgpy.species import Species, TransitionState
 from rmgpy.statmech.conformer import Conformer
 from rmgpy.statmech.rotation import NonlinearRotor
@@ -124,6 +124,16 @@ class TestReactionIsomorphism(unittest.TestCase):
         self.assertFalse(r1.is_isomorphic(self.make_reaction('ab=abc')))
         self.assertFalse(r1.is_isomorphic(self.make_reaction('abe=cde')))
 
+    def test3to4(self):
+        r1 = self.make_reaction('ABC=DEFG')
+        self.assertTrue(r1.is_isomorphic(self.make_reaction('cab=gfed')))
+        self.assertTrue(r1.is_isomorphic(self.make_reaction('gfed=bca')))
+        self.assertFalse(r1.is_isomorphic(self.make_reaction('gfed=bca'), either_direction=False))
+        self.assertFalse(r1.is_isomorphic(self.make_reaction('abc=defd')))
+        self.assertFalse(r1.is_isomorphic(self.make_reaction('aab=defg')))
+        with self.assertRaises(NotImplementedError):
+            same_species_lists([], [])
+
     def test2to3_using_check_only_label(self):
         r1 = self.make_reaction('AB=CDE')
         self.assertTrue(r1.is_isomorphic(self.make_reaction('AB=CDE'), check_only_label=True))
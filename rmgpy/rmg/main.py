@@ -372,6 +372,7 @@ class RMG(util.Subject):
             kinetics_depositories=self.kinetics_depositories,
             # frequenciesLibraries = self.statmech_libraries,
             depository=False,  # Don't bother loading the depository information, as we don't use it
+            procnum=determine_procnum_from_ram(),
         )
 
         # Turn off reversibility for families with three products if desired
@@ -61,6 +61,9 @@ def parse_command_line_arguments():
                         help='the Chemkin files and species dictionaries of the fourth model to merge')
     parser.add_argument('--model5', metavar='FILE', type=str, nargs='+',
                         help='the Chemkin files and species dictionaries of the fifth model to merge')
+    parser.add_argument('--model', metavar='FILE', type=str, nargs='+', action='append', default=[],
+                        help='the Chemkin files and species dictionaries of a model to merge '
+                             '(may be repeated; these follow any numbered models in the merge order)')
 
     args = parser.parse_args()
     return args
@@ -75,9 +78,10 @@ def main():
 
     transport = False
     input_model_files = []
-    for model in [args.model1, args.model2, args.model3, args.model4, args.model5]:
-        if model is None:
-            continue
+    models = [model for model in [args.model1, args.model2, args.model3, args.model4, args.model5]
+              if model is not None]
+    models.extend(args.model)
+    for model in models:
         if len(model) == 2:
             input_model_files.append((model[0], model[1], None))
         elif len(model) == 3: